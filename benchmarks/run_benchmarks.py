@@ -0,0 +1,218 @@
+"""
+Benchmark suite for the backtester hot paths.
+
+Times order fill checks, OMS operations, account valuation, candlestick
+ingestion and end-to-end simulation on synthetic data at several scales, and
+writes the results to JSON so runs on different commits can be compared.
+
+Usage:
+    uv run python benchmarks/run_benchmarks.py --scales 1 10 100 --output bench.json
+    uv run python benchmarks/run_benchmarks.py --scales 1 --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+from backtester.brokerage.account import Account, MarginAccount
+from backtester.brokerage.order import LimitOrder
+from backtester.brokerage.order_logic import check_order_fill
+from backtester.brokerage.order_management_system import OMS
+from backtester.simulation.data_processor import CandlestickProcessor
+from backtester.simulation.simulation import Simulation
+from backtester.simulation.synthetic import generate_bars, generate_orders
+
+SYMBOLS = [f"SYM{i}" for i in range(5)]
+
+
+class Workload(NamedTuple):
+    """A timed callable. When ``setup`` is given it runs untimed before every repeat and its result is passed to ``run``."""
+    run: Callable[..., None]
+    size: int
+    setup: Optional[Callable[[], Any]] = None
+
+
+def bench_check_order_fill(scale: int) -> Workload:
+    orders = generate_orders(SYMBOLS, 10_000 * scale, seed=1)
+    prices = [95.0 + (i % 10) for i in range(len(orders))]
+
+    def run():
+        for price, order in zip(prices, orders):
+            check_order_fill(price, order)
+    return Workload(run, len(orders))
+
+
+def bench_oms(scale: int) -> Workload:
+    n = 2_000 * scale
+
+    def setup():
+        # Orders are mutated when cancelled or executed, so every repeat needs fresh ones.
+        return generate_orders(SYMBOLS, n, seed=2)
+
+    def run(orders):
+        oms = OMS()
+        for order in orders:
+            oms.new_open_order(order)
+        for symbol in SYMBOLS:
+            oms.get_open_orders_by_symbol(symbol)
+        for i in range(0, n, 2):
+            oms.cancel_order(str(i))
+        for i in range(1, n, 2):
+            oms.execute_order(str(i), 100.0)
+    return Workload(run, n, setup)
+
+
+def bench_account_valuation(scale: int) -> Workload:
+    symbols = [f"SYM{i}" for i in range(50)]
+    price_dict = {symbol: 100.0 + i for i, symbol in enumerate(symbols)}
+    cash_account = Account()
+    margin_account = MarginAccount()
+    for account in (cash_account, margin_account):
+        account.holdings = {symbol: (i % 7) - 3 for i, symbol in enumerate(symbols)}
+        for order in generate_orders(symbols, 1_000 * scale, seed=3):
+            account.oms.new_open_order(order)
+    repeats = 20
+
+    def run():
+        for _ in range(repeats):
+            cash_account.get_portfolio_value(price_dict)
+            cash_account.get_cash_available_to_invest(price_dict)
+            margin_account.get_equity(price_dict)
+            margin_account.get_maintenance_excess(price_dict)
+            margin_account.get_open_order_initial_req(price_dict)
+            margin_account.get_open_order_maint_req(price_dict)
+    return Workload(run, repeats * 1_000 * scale)
+
+
+def bench_candlestick_ingestion(scale: int) -> Workload:
+    frames = generate_bars(SYMBOLS, 1_000 * scale, seed=4, freq="min")
+
+    def run():
+        processor = CandlestickProcessor()
+        for symbol, df in frames.items():
+            processor.add_data_frame(symbol, df, "timestamp", "open", "high", "low", "close")
+    return Workload(run, len(SYMBOLS) * 1_000 * scale)
+
+
+def bench_simulation(scale: int) -> Workload:
+    n_bars = 250 * scale
+    processor = CandlestickProcessor()
+    for symbol, df in generate_bars(SYMBOLS, n_bars, seed=5, freq="min").items():
+        processor.add_data_frame(symbol, df, "timestamp", "open", "high", "low", "close")
+
+    def strategy(sim: Simulation) -> None:
+        # Rebalance one symbol per bar with a resting limit order near the last close,
+        # cancelling that symbol's previous order so the book size stays constant and
+        # the per-bar cost is comparable across scales.
+        i = sim.current_time_index
+        stale = str(i - len(SYMBOLS))
+        if stale in sim.account.oms.open_orders:
+            sim.cancel_order(stale)
+        symbol = SYMBOLS[i % len(SYMBOLS)]
+        direction = "buy" if (i // len(SYMBOLS)) % 2 == 0 else "sell"
+        price = round(sim.price_dict[symbol], 2)
+        sim.submit_order(LimitOrder(str(i), symbol, 10, direction, "gtc", limit_price=price))
+
+    def run():
+        account = MarginAccount()
+        account.set_cash(1_000_000)
+        Simulation(account, strategy=strategy).run(processor)
+    return Workload(run, n_bars)
+
+
+BENCHMARKS: dict[str, Callable[[int], Workload]] = {
+    "check_order_fill": bench_check_order_fill,
+    "oms": bench_oms,
+    "account_valuation": bench_account_valuation,
+    "candlestick_ingestion": bench_candlestick_ingestion,
+    "simulation": bench_simulation,
+}
+
+
+def time_benchmark(name: str, scale: int, repeats: int) -> dict:
+    """Time one benchmark at one scale, returning the best and median of ``repeats`` runs."""
+    workload = BENCHMARKS[name](scale)
+    timings = []
+    for _ in range(repeats):
+        args = (workload.setup(),) if workload.setup is not None else ()
+        start = time.perf_counter()
+        workload.run(*args)
+        timings.append(time.perf_counter() - start)
+    return {
+        "name": name,
+        "scale": scale,
+        "size": workload.size,
+        "repeats": repeats,
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Return a message for every benchmark that is more than ``threshold`` slower than the baseline."""
+    previous = {(r["name"], r["scale"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["name"], result["scale"]))
+        if old is None:
+            continue
+        ratio = result["min_s"] / old["min_s"]
+        print(f"{result['name']:<24}x{result['scale']:<5}{old['min_s']:>12.6f}s -> {result['min_s']:>12.6f}s  ({ratio:.2f}x)")
+        if ratio > 1.0 + threshold:
+            regressions.append(f"{result['name']} at x{result['scale']} is {ratio:.2f}x slower")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=sorted(BENCHMARKS))
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before failing --compare")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scales:
+        for name in args.only:
+            result = time_benchmark(name, scale, args.repeats)
+            results.append(result)
+            print(f"{name:<24}x{scale:<5}{result['min_s']:>12.6f}s (median {result['median_s']:.6f}s)")
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION: {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+Rolling technical indicators.
+
+Each indicator is available in two forms: a streaming class with an O(1)
+``update`` for bar-by-bar use, and a vectorized function that computes the full
+series at once. ``IndicatorCache`` memoises full-series results per
+(source, indicator, params) so parameter sweeps and multiple strategies reuse
+the same computation.
+"""
+
+import math
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+__all__ = [
+    "SMA",
+    "EMA",
+    "RollingStd",
+    "ATR",
+    "sma",
+    "ema",
+    "rolling_std",
+    "atr",
+    "INDICATORS",
+    "IndicatorCache",
+]
+
+
+class SMA:
+    """
+    Streaming simple moving average.
+
+    Missing observations (``nan``) are handled like pandas' ``rolling(window).mean()``:
+    the average is ``nan`` while a missing value is inside the window and recovers
+    once it drops out.
+
+    Attributes
+    ----------
+    window : int
+        Number of observations in the average.
+    value : float
+        Current average, ``nan`` until ``window`` valid observations fill the window.
+    """
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.value: float = math.nan
+        self._buffer: deque = deque(maxlen=window)
+        self._sum: float = 0.0
+        self._nan_count: int = 0
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current average."""
+        if len(self._buffer) == self.window:
+            old = self._buffer[0]
+            if math.isnan(old):
+                self._nan_count -= 1
+            else:
+                self._sum -= old
+        self._buffer.append(x)
+        if math.isnan(x):
+            self._nan_count += 1
+        else:
+            self._sum += x
+        if len(self._buffer) == self.window and self._nan_count == 0:
+            self.value = self._sum / self.window
+        else:
+            self.value = math.nan
+        return self.value
+
+
+class EMA:
+    """
+    Streaming exponential moving average, seeded with the first observation.
+
+    Attributes
+    ----------
+    alpha : float
+        Smoothing factor, ``2 / (span + 1)`` unless given explicitly.
+    value : float
+        Current average, ``nan`` before the first observation.
+    """
+    def __init__(self, span: Optional[int] = None, alpha: Optional[float] = None):
+        if (span is None) == (alpha is None):
+            raise ValueError("exactly one of span or alpha must be given")
+        if alpha is None:
+            if span < 1:
+                raise ValueError("span must be at least 1")
+            alpha = 2.0 / (span + 1)
+        self.alpha = alpha
+        self.value: float = math.nan
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current average."""
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class RollingStd:
+    """
+    Streaming rolling sample standard deviation (ddof=1).
+
+    Uses a windowed Welford update so values are added and removed without
+    revisiting the window. Missing observations (``nan``) are kept out of the
+    running moments and, like pandas' ``rolling(window).std()``, make the result
+    ``nan`` while they are inside the window.
+
+    Attributes
+    ----------
+    window : int
+        Number of observations in the window.
+    value : float
+        Current standard deviation, ``nan`` until the window is full.
+    """
+    def __init__(self, window: int):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.value: float = math.nan
+        self._buffer: deque = deque(maxlen=window)
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._count: int = 0
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current standard deviation."""
+        if len(self._buffer) == self.window:
+            old = self._buffer[0]
+            if not math.isnan(old):
+                self._count -= 1
+                if self._count == 0:
+                    self._mean = 0.0
+                    self._m2 = 0.0
+                else:
+                    delta = old - self._mean
+                    self._mean -= delta / self._count
+                    self._m2 -= delta * (old - self._mean)
+        self._buffer.append(x)
+        if not math.isnan(x):
+            self._count += 1
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        if self._count == self.window:
+            self.value = math.sqrt(max(self._m2, 0.0) / (self._count - 1))
+        else:
+            self.value = math.nan
+        return self.value
+
+
+class ATR:
+    """
+    Streaming average true range with Wilder smoothing (``alpha = 1 / window``).
+
+    The smoother is seeded with the first bar's true range rather than Wilder's
+    usual seed, the simple average of the first ``window`` true ranges, so early
+    values differ slightly from charting packages until the seed decays.
+
+    Attributes
+    ----------
+    window : int
+        Smoothing period.
+    value : float
+        Current ATR, ``nan`` until ``window`` bars have been seen.
+    """
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.value: float = math.nan
+        self._ema = EMA(alpha=1.0 / window)
+        self._prev_close: Optional[float] = None
+        self._count: int = 0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Add a bar and return the current ATR."""
+        if self._prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        self._count += 1
+        smoothed = self._ema.update(true_range)
+        if self._count >= self.window:
+            self.value = smoothed
+        return self.value
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Vectorized simple moving average.
+
+    Args:
+        values: 1-D array of observations.
+        window: Number of observations in the average.
+
+    Returns:
+        np.ndarray: Average per observation, ``nan`` until the window is full.
+    """
+    import pandas as pd
+    return pd.Series(values, dtype=float).rolling(window).mean().to_numpy()
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Vectorized exponential moving average, seeded with the first observation.
+
+    Args:
+        values: 1-D array of observations.
+        span: Span of the average, giving ``alpha = 2 / (span + 1)``.
+
+    Returns:
+        np.ndarray: Average per observation.
+    """
+    import pandas as pd
+    return pd.Series(values, dtype=float).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Vectorized rolling sample standard deviation (ddof=1).
+
+    Args:
+        values: 1-D array of observations.
+        window: Number of observations in the window.
+
+    Returns:
+        np.ndarray: Standard deviation per observation, ``nan`` until the window is full.
+    """
+    import pandas as pd
+    return pd.Series(values, dtype=float).rolling(window).std().to_numpy()
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Vectorized average true range with Wilder smoothing.
+
+    Matches ``ATR``: the smoother is seeded with the first bar's true range, not
+    the simple average of the first ``window`` true ranges.
+
+    Args:
+        high: 1-D array of bar highs.
+        low: 1-D array of bar lows.
+        close: 1-D array of bar closes.
+        window: Smoothing period.
+
+    Returns:
+        np.ndarray: ATR per bar, ``nan`` for the first ``window - 1`` bars.
+    """
+    import pandas as pd
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    smoothed = pd.Series(true_range).ewm(alpha=1.0 / window, adjust=False).mean().to_numpy()
+    smoothed[:window - 1] = np.nan
+    return smoothed
+
+
+# Maps indicator names to their batch function and the frame columns it consumes.
+INDICATORS: dict[str, tuple[Callable[..., np.ndarray], tuple[str, ...]]] = {
+    "sma": (sma, ("close",)),
+    "ema": (ema, ("close",)),
+    "rolling_std": (rolling_std, ("close",)),
+    "atr": (atr, ("high", "low", "close")),
+}
+
+
+class IndicatorCache:
+    """
+    Least-recently-used cache of computed indicator series.
+
+    Entries are keyed by ``(source, indicator, params)``, where ``source`` is a
+    content fingerprint of the input data rather than its name, so one cache can
+    be shared by several processors without them seeing each other's series.
+    Cached arrays are marked read-only since they are shared between callers.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of series kept before the least recently used is evicted.
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that had to compute the series.
+    """
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(source: str, indicator: str, params: dict[str, Hashable]) -> tuple:
+        """Build a cache key that does not depend on parameter order. ``source`` should identify the data's content."""
+        return (source, indicator, tuple(sorted(params.items())))
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Return the cached series for ``key``, computing and storing it on a miss.
+
+        Args:
+            key: Cache key, usually from ``make_key``.
+            compute: Zero-argument callable producing the series.
+
+        Returns:
+            np.ndarray: The read-only indicator series.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        result = np.asarray(compute())
+        result.setflags(write=False)
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, source: Optional[str] = None) -> None:
+        """Drop every entry for the ``source`` fingerprint, or all entries if no source is given."""
+        if source is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == source]:
+            del self._entries[key]
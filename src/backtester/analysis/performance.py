@@ -0,0 +1,320 @@
+"""
+Performance analytics for backtest runs.
+
+Two flavours of every metric are provided: online estimators that consume one
+observation per bar in O(1) memory (suitable for feeding straight from the
+simulation loop), and vectorized batch functions that compute the same numbers
+from a recorded equity curve.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+__all__ = [
+    "RunningMoments",
+    "DrawdownTracker",
+    "OnlinePerformance",
+    "returns_from_equity",
+    "drawdown_series",
+    "batch_performance",
+]
+
+
+class RunningMoments:
+    """
+    Single-pass mean and variance using Welford's algorithm.
+
+    Attributes
+    ----------
+    count : int
+        Number of observations seen.
+    mean : float
+        Running mean of the observations.
+    """
+    def __init__(self):
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+
+    def update(self, value: float) -> None:
+        """Add a single observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1). Zero until two observations are seen."""
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        return math.sqrt(self.variance)
+
+
+class DrawdownTracker:
+    """
+    Single-pass maximum drawdown and drawdown duration.
+
+    Durations are measured in bars spent below the running peak.
+
+    Attributes
+    ----------
+    peak : float
+        Highest equity value seen so far.
+    max_drawdown : float
+        Largest peak-to-trough decline seen so far, as a positive fraction.
+    current_duration : int
+        Number of bars since the last peak.
+    max_duration : int
+        Longest number of bars spent below a peak.
+    """
+    def __init__(self):
+        self.peak: float = -math.inf
+        self.max_drawdown: float = 0.0
+        self.current_duration: int = 0
+        self.max_duration: int = 0
+
+    def update(self, equity: float) -> None:
+        """Add a single equity observation."""
+        if equity >= self.peak:
+            self.peak = equity
+            self.current_duration = 0
+            return
+        self.current_duration += 1
+        if self.current_duration > self.max_duration:
+            self.max_duration = self.current_duration
+        if self.peak > 0:
+            drawdown = 1.0 - equity / self.peak
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+
+
+class OnlinePerformance:
+    """
+    Streaming performance summary for a single backtest run.
+
+    Call ``update`` once per bar with the account equity and, optionally, the
+    gross exposure and traded notional for that bar. Nothing is retained
+    beyond a handful of running sums, so thousands of runs can be summarised
+    without storing their equity curves.
+
+    Attributes
+    ----------
+    periods_per_year : int
+        Number of bars per year, used to annualise volatility and ratios.
+    risk_free_rate : float
+        Per-period risk free rate subtracted from returns for Sharpe/Sortino.
+    returns : RunningMoments
+        Running moments of the per-bar returns.
+    drawdown : DrawdownTracker
+        Running drawdown statistics of the equity curve.
+    """
+    def __init__(self, periods_per_year: int = 252, risk_free_rate: float = 0.0):
+        self.periods_per_year = periods_per_year
+        self.risk_free_rate = risk_free_rate
+        self.returns = RunningMoments()
+        self.drawdown = DrawdownTracker()
+        self.initial_equity: Optional[float] = None
+        self.last_equity: Optional[float] = None
+        self.bars: int = 0
+        self._downside_sq_sum: float = 0.0
+        self._turnover: float = 0.0
+        self._exposure_sum: float = 0.0
+
+    def update(self, equity: float, gross_exposure: float = 0.0, traded_value: float = 0.0) -> None:
+        """
+        Record one bar.
+
+        Parameters
+        ----------
+        equity : float
+            Account equity (portfolio value) at the end of the bar.
+        gross_exposure : float, default=0.0
+            Sum of absolute position values at the end of the bar.
+        traded_value : float, default=0.0
+            Absolute notional traded during the bar.
+        """
+        if self.last_equity is None:
+            self.initial_equity = equity
+        elif self.last_equity != 0:
+            ret = equity / self.last_equity - 1.0
+            self.returns.update(ret)
+            excess = ret - self.risk_free_rate
+            if excess < 0:
+                self._downside_sq_sum += excess * excess
+        if equity != 0:
+            self._turnover += abs(traded_value) / equity
+            self._exposure_sum += gross_exposure / equity
+        self.drawdown.update(equity)
+        self.last_equity = equity
+        self.bars += 1
+
+    def summary(self) -> dict[str, float]:
+        """
+        Return the current metrics.
+
+        Returns
+        -------
+        dict[str, float]
+            Dictionary with keys ``bars``, ``total_return``, ``mean_return``,
+            ``volatility``, ``sharpe``, ``sortino``, ``max_drawdown``,
+            ``max_drawdown_duration``, ``turnover`` and ``average_exposure``.
+        """
+        total_return = 0.0
+        if self.initial_equity:
+            total_return = self.last_equity / self.initial_equity - 1.0
+        n = self.returns.count
+        downside_dev = math.sqrt(self._downside_sq_sum / n) if n else 0.0
+        return _summarise(
+            bars=self.bars,
+            total_return=total_return,
+            mean_return=self.returns.mean,
+            std=self.returns.std,
+            downside_dev=downside_dev,
+            max_drawdown=self.drawdown.max_drawdown,
+            max_duration=self.drawdown.max_duration,
+            turnover=self._turnover,
+            exposure_sum=self._exposure_sum,
+            periods_per_year=self.periods_per_year,
+            risk_free_rate=self.risk_free_rate,
+        )
+
+
+def _summarise(bars: int,
+               total_return: float,
+               mean_return: float,
+               std: float,
+               downside_dev: float,
+               max_drawdown: float,
+               max_duration: int,
+               turnover: float,
+               exposure_sum: float,
+               periods_per_year: int,
+               risk_free_rate: float,
+               ) -> dict[str, float]:
+    """Build the summary dictionary shared by the online and batch paths."""
+    annualiser = math.sqrt(periods_per_year)
+    excess_mean = mean_return - risk_free_rate
+    return {
+        "bars": bars,
+        "total_return": total_return,
+        "mean_return": mean_return,
+        "volatility": std * annualiser,
+        "sharpe": excess_mean / std * annualiser if std > 0 else 0.0,
+        "sortino": excess_mean / downside_dev * annualiser if downside_dev > 0 else 0.0,
+        "max_drawdown": max_drawdown,
+        "max_drawdown_duration": max_duration,
+        "turnover": turnover,
+        "average_exposure": exposure_sum / bars if bars else 0.0,
+    }
+
+
+def returns_from_equity(equity: np.ndarray) -> np.ndarray:
+    """
+    Compute simple per-bar returns from an equity curve.
+
+    Returns following a bar with zero equity are undefined and set to ``nan``,
+    matching ``OnlinePerformance``, which skips them.
+
+    Args:
+        equity: 1-D array of equity values.
+
+    Returns:
+        np.ndarray: Array of length ``len(equity) - 1``.
+    """
+    equity = np.asarray(equity, dtype=float)
+    previous = equity[:-1]
+    ratio = np.divide(equity[1:], previous, out=np.full(len(previous), np.nan), where=previous != 0)
+    return ratio - 1.0
+
+
+def drawdown_series(equity: np.ndarray) -> np.ndarray:
+    """
+    Compute the drawdown at every bar as a positive fraction of the running peak.
+
+    As in ``DrawdownTracker``, drawdown is zero while the running peak is not positive.
+
+    Args:
+        equity: 1-D array of equity values.
+
+    Returns:
+        np.ndarray: Drawdown per bar, same length as ``equity``.
+    """
+    equity = np.asarray(equity, dtype=float)
+    peaks = np.maximum.accumulate(equity)
+    ratio = np.divide(equity, peaks, out=np.ones(len(equity)), where=peaks > 0)
+    return 1.0 - ratio
+
+
+def _max_drawdown_duration(equity: np.ndarray) -> int:
+    """Longest run of bars spent strictly below the running peak."""
+    below = equity < np.maximum.accumulate(equity)
+    if not below.any():
+        return 0
+    # Length of each run of True values, via the positions where runs reset.
+    idx = np.arange(len(below))
+    last_reset = np.maximum.accumulate(np.where(~below, idx, -1))
+    return int(((idx - last_reset) * below).max())
+
+
+def batch_performance(equity: np.ndarray,
+                      gross_exposure: Optional[np.ndarray] = None,
+                      traded_value: Optional[np.ndarray] = None,
+                      periods_per_year: int = 252,
+                      risk_free_rate: float = 0.0,
+                      ) -> dict[str, float]:
+    """
+    Vectorized equivalent of ``OnlinePerformance`` for a recorded equity curve.
+
+    Args:
+        equity: 1-D array of equity values, one per bar.
+        gross_exposure: Optional 1-D array of gross exposure per bar.
+        traded_value: Optional 1-D array of traded notional per bar.
+        periods_per_year: Number of bars per year used for annualisation.
+        risk_free_rate: Per-period risk free rate.
+
+    Returns:
+        dict[str, float]: Same keys as ``OnlinePerformance.summary``.
+
+    Raises:
+        ValueError: If the optional arrays do not match the length of ``equity``.
+    """
+    equity = np.asarray(equity, dtype=float)
+    bars = len(equity)
+    for name, arr in (("gross_exposure", gross_exposure), ("traded_value", traded_value)):
+        if arr is not None and len(arr) != bars:
+            raise ValueError(f"{name} must have the same length as equity")
+    if bars == 0:
+        return _summarise(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0.0, 0.0, periods_per_year, risk_free_rate)
+
+    returns = returns_from_equity(equity)
+    returns = returns[~np.isnan(returns)]
+    n = len(returns)
+    std = float(returns.std(ddof=1)) if n > 1 else 0.0
+    excess = returns - risk_free_rate
+    downside_dev = float(np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2))) if n else 0.0
+
+    inv_equity = np.divide(1.0, equity, out=np.zeros(bars), where=equity != 0)
+    turnover = float(np.sum(np.abs(traded_value) * inv_equity)) if traded_value is not None else 0.0
+    exposure_sum = float(np.sum(np.asarray(gross_exposure) * inv_equity)) if gross_exposure is not None else 0.0
+
+    return _summarise(
+        bars=bars,
+        total_return=float(equity[-1] / equity[0] - 1.0) if equity[0] else 0.0,
+        mean_return=float(returns.mean()) if n else 0.0,
+        std=std,
+        downside_dev=downside_dev,
+        max_drawdown=float(drawdown_series(equity).max()),
+        max_duration=_max_drawdown_duration(equity),
+        turnover=turnover,
+        exposure_sum=exposure_sum,
+        periods_per_year=periods_per_year,
+        risk_free_rate=risk_free_rate,
+    )
@@ -0,0 +1,23 @@
+"""
+Brokerage core: orders, order matching, the OMS and accounts.
+
+Only the standard library is needed to import this package, so sweep workers
+that just need orders and accounts do not pay for pandas.
+"""
+
+from backtester.brokerage.account import Account, CashAccount, MarginAccount
+from backtester.brokerage.order import Order, MarketOrder, LimitOrder, StopOrder
+from backtester.brokerage.order_logic import check_order_fill
+from backtester.brokerage.order_management_system import OMS
+
+__all__ = [
+    "Account",
+    "CashAccount",
+    "MarginAccount",
+    "Order",
+    "MarketOrder",
+    "LimitOrder",
+    "StopOrder",
+    "check_order_fill",
+    "OMS",
+]
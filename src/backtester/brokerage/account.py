@@ -1,6 +1,6 @@
 # class containing the blueprint for a fake brokerage account
 from backtester.brokerage.order_management_system import OMS
-from backtester.brokerage.order import *
+from backtester.brokerage.order import MarketOrder, LimitOrder, StopOrder
 
 class Account:
     """
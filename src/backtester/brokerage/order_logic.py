@@ -1,6 +1,7 @@
-from .order import *
 import numbers
 
+from .order import Order, MarketOrder, LimitOrder, StopOrder
+
 def check_order_fill(price: float, order: Order) -> bool:
     """
     Check if an order should be filled at the given price.
@@ -1,4 +1,4 @@
-from .order import *
+from .order import Order
 
 class OMS:
     """
@@ -19,16 +19,20 @@ class OMS:
             print(f"Unexpected error in get_open_orders_by_symbol: {e}")
             return []
     
-    def new_open_order(self, order: Order) -> None:
+    def new_open_order(self, order: Order) -> bool:
+        """Add an order to the open orders. Returns True if it was accepted."""
         try:
             if order.order_id in self.open_orders:
                 print(f"Order ID {order.order_id} already exists in open orders")
             else:
                 self.open_orders[order.order_id] = order
+                return True
         except Exception as e:
             print(f"Unexpected error in new_order: {e}")
+        return False
         
-    def cancel_order(self, order_id) -> None:
+    def cancel_order(self, order_id) -> bool:
+        """Move an open order to the cancelled orders. Returns True if it was cancelled."""
         try:
             if order_id not in self.open_orders:
                 print(f"Order ID {order_id} does not exist in open_orders.")
@@ -36,8 +40,24 @@ class OMS:
                 self.open_orders[order_id].status = "cancelled"
                 self.cancelled_orders[order_id] = self.open_orders[order_id]
                 del self.open_orders[order_id]
+                return True
         except KeyError as e:
             print(f"Key error while cancelling order ID {order_id}: {e}")
         except Exception as e:
             print(f"Unexpected error in cancel_order: {e}")
+        return False
 
+    def execute_order(self, order_id, price: float) -> bool:
+        """Move an open order to the executed orders at ``price``. Returns True if it was executed."""
+        try:
+            if order_id not in self.open_orders:
+                print(f"Order ID {order_id} does not exist in open_orders.")
+            else:
+                order = self.open_orders.pop(order_id)
+                order.status = "executed"
+                order.executed_price = price
+                self.executed_orders[order_id] = order
+                return True
+        except Exception as e:
+            print(f"Unexpected error in execute_order: {e}")
+        return False
@@ -0,0 +1,47 @@
+"""
+Simulation engine, data ingestion and run tooling.
+
+Names are resolved lazily on first access so that importing the package (for
+example to reach ``Simulation``) does not import pandas unless data
+processing is actually used.
+"""
+
+import importlib
+
+__all__ = [
+    "Simulation",
+    "CandlestickProcessor",
+    "Instrumentation",
+    "StackSampler",
+    "ResultCache",
+    "restore",
+    "fork_variants",
+    "generate_bars",
+    "generate_orders",
+]
+
+# ``snapshot()`` is not re-exported: it would clash with the ``snapshot``
+# submodule, which Python binds on this package once it is imported.
+_LAZY_EXPORTS = {
+    "Simulation": "backtester.simulation.simulation",
+    "CandlestickProcessor": "backtester.simulation.data_processor",
+    "Instrumentation": "backtester.simulation.instrumentation",
+    "StackSampler": "backtester.simulation.instrumentation",
+    "ResultCache": "backtester.simulation.result_cache",
+    "restore": "backtester.simulation.snapshot",
+    "fork_variants": "backtester.simulation.snapshot",
+    "generate_bars": "backtester.simulation.synthetic",
+    "generate_orders": "backtester.simulation.synthetic",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -2,18 +2,29 @@
 Work in progress. This module will be used to process data from CSV files and Pandas DataFrames.
 """
 
+from __future__ import annotations
+
+import hashlib
 from pathlib import Path
-from typing import Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Optional
+
+from backtester.analysis.indicators import INDICATORS, IndicatorCache
+
+# pandas is imported on first use so that importing this module stays cheap.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 class CandlestickProcessor:
     """
     This class is used to process candlestick data from CSV files and Pandas DataFrames for backtesting.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, indicator_cache: Optional[IndicatorCache] = None) -> None:
         self.data_sources: dict[str, pd.DataFrame] = {}
         self.processed_data: Optional[pd.DataFrame] = None
+        self.source_fingerprints: dict[str, str] = {}
+        self.indicator_cache = indicator_cache if indicator_cache is not None else IndicatorCache()
 
     def add_csv_data(self, 
                      source_name: str, 
@@ -38,6 +49,7 @@ class CandlestickProcessor:
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
+        import pandas as pd
         df = pd.read_csv(file_path)
         self.add_data_frame(source_name, df, timestamp_column, open_column, high_column, low_column, close_column)
 
@@ -61,6 +73,7 @@ class CandlestickProcessor:
             low_column: Name of the low column.
             close_column: Name of the close column.
         """
+        import pandas as pd
         required_columns = [timestamp_column, open_column, high_column, low_column, close_column]
         missing_columns = [col for col in required_columns if col not in df.columns]
         if missing_columns:
@@ -77,10 +90,65 @@ class CandlestickProcessor:
         new_df['timestamp'] = pd.to_datetime(new_df['timestamp'])
         new_df.set_index('timestamp', inplace=True)
         self.data_sources[source_name] = new_df
+        self.source_fingerprints[source_name] = self._hash_frame(new_df)
+
+    @staticmethod
+    def _hash_frame(df: pd.DataFrame) -> str:
+        """Hash a frame's columns, index and values."""
+        import pandas as pd
+        digest = hashlib.sha256()
+        digest.update(",".join(map(str, df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def fingerprint(self) -> str:
+        """
+        Hash the contents of every data source.
+        Returns:
+            Hex digest that changes whenever any source's name, index or values change.
+        """
+        digest = hashlib.sha256()
+        for source_name in sorted(self.data_sources):
+            digest.update(source_name.encode())
+            digest.update(self.source_fingerprints[source_name].encode())
+        return digest.hexdigest()
+
+    def get_indicator(self, source_name: str, indicator: str, **params) -> np.ndarray:
+        """
+        Compute an indicator over a data source, reusing a cached result when available.
+        Args:
+            source_name: Name of the data source.
+            indicator: Name of the indicator, one of the keys of ``INDICATORS``.
+            **params: Keyword arguments for the indicator function, e.g. ``window=20``.
+        Returns:
+            Read-only array aligned with the rows of the data source.
+        """
+        if source_name not in self.data_sources:
+            raise KeyError(f"Unknown data source: {source_name}")
+        if indicator not in INDICATORS:
+            raise ValueError(f"Unknown indicator: {indicator}")
+        func, columns = INDICATORS[indicator]
+        df = self.data_sources[source_name]
+        # Key on the data's content, not its name, so a shared cache never mixes up sources.
+        key = self.indicator_cache.make_key(self.source_fingerprints[source_name], indicator, params)
+        return self.indicator_cache.get_or_compute(
+            key, lambda: func(*(df[col].to_numpy() for col in columns), **params)
+        )
 
     def _detect_timeframe(self, df: pd.DataFrame) -> str:
         pass
 
         
     def _merge_by_timestamp(self) -> pd.DataFrame:
-        pass
\ No newline at end of file
+        """
+        Align the close prices of every data source on a shared timestamp index.
+        Returns:
+            DataFrame with one close column per source, NaN where a source has no bar.
+        """
+        if not self.data_sources:
+            raise ValueError("no data sources have been added")
+        import pandas as pd
+        self.processed_data = pd.concat(
+            {name: df['close'] for name, df in self.data_sources.items()}, axis=1
+        ).sort_index()
+        return self.processed_data
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+Low-overhead instrumentation for the simulation loop.
+
+Attach an ``Instrumentation`` to a ``Simulation`` to collect per-phase timings
+(data iteration, order checks, fills, strategy, valuation) and counters
+(bars, orders submitted/filled/cancelled). When no instrumentation is attached
+the simulation takes an untimed path, so the disabled cost is a single
+attribute check per bar. An optional ``StackSampler`` periodically samples the
+simulation thread's stack to show where time goes inside each phase.
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+__all__ = [
+    "Instrumentation",
+    "StackSampler",
+]
+
+
+class StackSampler:
+    """
+    Sampling profiler that records the innermost frame of a thread at a fixed interval.
+
+    Attributes
+    ----------
+    interval : float
+        Seconds between samples.
+    samples : Counter
+        Number of samples per ``"file:line function"`` location.
+    """
+    def __init__(self, interval: float = 0.005):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._target_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        if self._thread is not None:
+            return
+        self._target_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="backtester-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def top(self, n: int = 10) -> list[tuple[str, int]]:
+        """Return the ``n`` most frequently sampled locations."""
+        return self.samples.most_common(n)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            if frame is not None:
+                code = frame.f_code
+                self.samples[f"{code.co_filename}:{frame.f_lineno} {code.co_name}"] += 1
+
+
+class Instrumentation:
+    """
+    Per-run timers and counters for a simulation.
+
+    Attributes
+    ----------
+    phase_ns : dict[str, int]
+        Total nanoseconds spent in each phase.
+    phase_calls : dict[str, int]
+        Number of timed intervals recorded for each phase.
+    counters : dict[str, int]
+        Event counters such as ``bars`` and ``orders_filled``.
+    sampler : StackSampler, optional
+        Sampling profiler started and stopped with the run.
+    """
+    def __init__(self, sampler: Optional[StackSampler] = None):
+        self.phase_ns: dict[str, int] = {}
+        self.phase_calls: dict[str, int] = {}
+        self.counters: dict[str, int] = {}
+        self.sampler = sampler
+        self._started_ns: Optional[int] = None
+        self._wall_ns: int = 0
+
+    def start(self) -> None:
+        """Mark the start of the run and start the sampler, if any."""
+        self._started_ns = time.perf_counter_ns()
+        if self.sampler is not None:
+            self.sampler.start()
+
+    def stop(self) -> None:
+        """Mark the end of the run and stop the sampler, if any."""
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self._started_ns is not None:
+            self._wall_ns += time.perf_counter_ns() - self._started_ns
+            self._started_ns = None
+
+    def add_time(self, phase: str, elapsed_ns: int) -> None:
+        """Add ``elapsed_ns`` nanoseconds to ``phase``."""
+        self.phase_ns[phase] = self.phase_ns.get(phase, 0) + elapsed_ns
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment counter ``name`` by ``n``."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def phase(self, name: str) -> "_PhaseTimer":
+        """Context manager timing the enclosed block as ``name``, e.g. inside strategy code."""
+        return _PhaseTimer(self, name)
+
+    def report(self) -> dict:
+        """
+        Build the per-run report.
+
+        Returns:
+            dict: ``wall_time_s``, ``phases`` (calls, total and mean time per
+            phase, share of wall time), ``counters`` and, with a sampler, ``samples``.
+        """
+        wall_ns = self._wall_ns
+        if self._started_ns is not None:
+            wall_ns += time.perf_counter_ns() - self._started_ns
+        phases = {}
+        for name, total_ns in sorted(self.phase_ns.items(), key=lambda item: -item[1]):
+            calls = self.phase_calls[name]
+            phases[name] = {
+                "calls": calls,
+                "total_s": total_ns / 1e9,
+                "mean_us": total_ns / calls / 1e3,
+                "share": total_ns / wall_ns if wall_ns else 0.0,
+            }
+        report = {"wall_time_s": wall_ns / 1e9, "phases": phases, "counters": dict(self.counters)}
+        if self.sampler is not None:
+            report["samples"] = self.sampler.top()
+        return report
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Return the report as a JSON string."""
+        return json.dumps(self.report(), indent=indent)
+
+    def to_table(self) -> str:
+        """Return the report as a plain-text table."""
+        report = self.report()
+        lines = [f"wall time: {report['wall_time_s']:.6f}s", ""]
+        lines.append(f"{'phase':<16}{'calls':>10}{'total (s)':>14}{'mean (us)':>12}{'share':>8}")
+        for name, stats in report["phases"].items():
+            lines.append(
+                f"{name:<16}{stats['calls']:>10}{stats['total_s']:>14.6f}"
+                f"{stats['mean_us']:>12.2f}{stats['share']:>8.1%}"
+            )
+        lines.append("")
+        lines.append(f"{'counter':<26}{'value':>10}")
+        for name, value in sorted(report["counters"].items()):
+            lines.append(f"{name:<26}{value:>10}")
+        for location, hits in report.get("samples", []):
+            lines.append(f"{hits:>6}  {location}")
+        return "\n".join(lines)
+
+
+class _PhaseTimer:
+    __slots__ = ("_instrumentation", "_name", "_start")
+
+    def __init__(self, instrumentation: Instrumentation, name: str):
+        self._instrumentation = instrumentation
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        self._instrumentation.add_time(self._name, time.perf_counter_ns() - self._start)
@@ -0,0 +1,323 @@
+"""
+Asyncio feed adapters for driving a simulation from live or replayed bars.
+
+Bars arrive from an asynchronous source (a TCP socket or a file being
+tailed), pass through a bounded queue that applies backpressure to the
+producer, and are consumed by ``LiveRunner``, which calls the same
+``Simulation.step`` used by historical runs. ``ReplayPublisher`` is a local
+stand-in that serves recorded bars over TCP at wall-clock or accelerated speed.
+
+Bars travel as newline-delimited JSON objects of the form
+``{"timestamp": "2024-01-02T09:30:00", "prices": {"SPY": 470.1}}``.
+"""
+
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
+
+from backtester.analysis.performance import RunningMoments
+from backtester.simulation.simulation import Simulation
+
+__all__ = [
+    "Bar",
+    "LatencyStats",
+    "BarQueue",
+    "socket_feed",
+    "file_tail_feed",
+    "ReplayPublisher",
+    "LiveRunner",
+]
+
+
+@dataclass
+class Bar:
+    """
+    A single bar received from a feed.
+
+    Attributes
+    ----------
+    timestamp : datetime
+        Market time of the bar.
+    prices : dict[str, float]
+        Price per symbol.
+    received_at : float
+        ``time.perf_counter()`` when the bar was received, used for latency.
+    """
+    timestamp: datetime
+    prices: dict[str, float]
+    received_at: float = field(default_factory=time.perf_counter)
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> "Bar":
+        """Parse a bar from its JSON line representation."""
+        data = json.loads(line)
+        return cls(datetime.fromisoformat(data["timestamp"]), {k: float(v) for k, v in data["prices"].items()})
+
+    def to_json(self) -> str:
+        """Serialise the bar to a JSON line (without the trailing newline)."""
+        return json.dumps({"timestamp": self.timestamp.isoformat(), "prices": self.prices})
+
+
+class LatencyStats:
+    """
+    Online statistics of event-to-decision latency, in seconds.
+
+    Attributes
+    ----------
+    moments : RunningMoments
+        Running mean and variance of the latencies.
+    max : float
+        Largest latency seen.
+    """
+    def __init__(self):
+        self.moments = RunningMoments()
+        self.max: float = 0.0
+
+    def update(self, latency: float) -> None:
+        """Record one latency observation."""
+        self.moments.update(latency)
+        if latency > self.max:
+            self.max = latency
+
+    def summary(self) -> dict[str, float]:
+        """Return the count, mean, standard deviation and maximum latency."""
+        return {
+            "count": self.moments.count,
+            "mean": self.moments.mean,
+            "std": self.moments.std,
+            "max": self.max,
+        }
+
+
+class BarQueue:
+    """
+    Bounded queue between a feed and a consumer.
+
+    ``put`` waits while the queue is full, so a fast producer is slowed to the
+    pace of the consumer instead of buffering without limit. ``close`` marks the
+    end of the stream.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of bars buffered.
+    high_water_mark : int
+        Largest number of bars buffered at once.
+    blocked_puts : int
+        Number of ``put`` calls that had to wait for space.
+    """
+    _CLOSED = object()
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.high_water_mark: int = 0
+        self.blocked_puts: int = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def put(self, bar: Bar) -> None:
+        """Enqueue a bar, waiting for space if the queue is full."""
+        if self._queue.full():
+            self.blocked_puts += 1
+        await self._queue.put(bar)
+        self.high_water_mark = max(self.high_water_mark, self._queue.qsize())
+
+    async def close(self) -> None:
+        """Signal that no more bars will be put."""
+        await self._queue.put(self._CLOSED)
+
+    async def pump(self, feed: AsyncIterator[Bar]) -> None:
+        """Copy every bar from ``feed`` into the queue, then close it."""
+        try:
+            async for bar in feed:
+                await self.put(bar)
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            await self.close()
+            raise
+        await self.close()
+
+    def __aiter__(self) -> "BarQueue":
+        return self
+
+    async def __anext__(self) -> Bar:
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            raise StopAsyncIteration
+        return item
+
+
+async def socket_feed(host: str, port: int) -> AsyncIterator[Bar]:
+    """
+    Yield bars read from a TCP stream of JSON lines until the peer closes it.
+
+    Args:
+        host: Host to connect to.
+        port: Port to connect to.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                yield Bar.from_json(line)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def file_tail_feed(file_path: Path | str,
+                         poll_interval: float = 0.1,
+                         idle_timeout: Optional[float] = None,
+                         ) -> AsyncIterator[Bar]:
+    """
+    Yield bars from a JSON lines file, following it as it grows.
+
+    Args:
+        file_path: File to tail.
+        poll_interval: Seconds to wait before checking for new lines.
+        idle_timeout: Stop after this many seconds without a new line. None follows forever.
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Feed file not found: {file_path}")
+    idle = 0.0
+    partial = ""
+    with file_path.open("r") as f:
+        while idle_timeout is None or idle < idle_timeout:
+            chunk = f.readline()
+            if not chunk:
+                await asyncio.sleep(poll_interval)
+                idle += poll_interval
+                continue
+            idle = 0.0
+            partial += chunk
+            # A line without a newline is still being written; wait for the rest.
+            if not partial.endswith("\n"):
+                continue
+            line, partial = partial, ""
+            if line.strip():
+                yield Bar.from_json(line)
+
+
+class ReplayPublisher:
+    """
+    Local TCP server that publishes recorded bars, standing in for a live source.
+
+    Bars are spaced by the gap between their timestamps divided by ``speed``.
+    ``speed=1`` replays at wall-clock pace and ``speed=math.inf`` as fast as
+    the connection allows.
+
+    Attributes
+    ----------
+    bars : list[Bar]
+        Bars to publish to each client.
+    speed : float
+        Replay speed multiplier.
+    port : int
+        Port the server is listening on, once started.
+    """
+    def __init__(self, bars: Iterable[Bar], speed: float = math.inf, host: str = "127.0.0.1", port: int = 0):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.bars = list(bars)
+        self.speed = speed
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self) -> None:
+        """Start listening. With ``port=0`` an ephemeral port is chosen."""
+        self._server = await asyncio.start_server(self._publish, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "ReplayPublisher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _publish(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        previous: Optional[datetime] = None
+        try:
+            for bar in self.bars:
+                if previous is not None and math.isfinite(self.speed):
+                    await asyncio.sleep((bar.timestamp - previous).total_seconds() / self.speed)
+                previous = bar.timestamp
+                writer.write((bar.to_json() + "\n").encode())
+                # drain() waits when the client is slow to read: TCP backpressure.
+                await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+class LiveRunner:
+    """
+    Drive a simulation from an asynchronous bar source.
+
+    Each bar is passed to ``Simulation.step``, so order matching, account
+    updates and the strategy run exactly as in a historical run. The time from
+    a bar's arrival to the end of the step is recorded as its latency.
+
+    Attributes
+    ----------
+    simulation : Simulation
+        Simulation being driven.
+    latency : LatencyStats
+        Event-to-decision latency statistics.
+    """
+    def __init__(self, simulation: Simulation):
+        self.simulation = simulation
+        self.latency = LatencyStats()
+
+    async def consume(self, bars: AsyncIterator[Bar]) -> None:
+        """Step the simulation on every bar until the source is exhausted."""
+        instrumentation = self.simulation.instrumentation
+        if instrumentation is not None:
+            instrumentation.start()
+        try:
+            async for bar in bars:
+                self.simulation.step(bar.prices, bar.timestamp)
+                self.latency.update(time.perf_counter() - bar.received_at)
+        finally:
+            if instrumentation is not None:
+                instrumentation.stop()
+
+    async def run(self, feed: AsyncIterator[Bar], maxsize: int = 1024) -> BarQueue:
+        """
+        Pump ``feed`` through a bounded queue into the simulation.
+
+        Args:
+            feed: Asynchronous bar source, e.g. ``socket_feed`` or ``file_tail_feed``.
+            maxsize: Capacity of the queue between the feed and the simulation.
+
+        Returns:
+            BarQueue: The queue, for inspecting its backpressure counters.
+        """
+        queue = BarQueue(maxsize)
+        producer = asyncio.create_task(queue.pump(feed))
+        try:
+            await self.consume(queue)
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        # Surface a feed error rather than ending silently on a truncated stream.
+        if not producer.cancelled() and producer.exception() is not None:
+            raise producer.exception()
+        return queue
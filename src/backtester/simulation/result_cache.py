@@ -0,0 +1,350 @@
+"""
+Content-addressed on-disk cache for backtest results.
+
+A run is keyed by a hash of everything that determines its outcome: the input
+data, the simulation window, cursor and warm state (last prices, open orders,
+day-order sessions, performance tracker), the account type, balances and margin
+requirements, the strategy parameters and the strategy code.
+Re-running an unchanged configuration returns the stored summary and equity
+curve instead of recomputing it.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from backtester.simulation.data_processor import CandlestickProcessor
+    from backtester.simulation.simulation import Simulation
+
+__all__ = [
+    "CachedResult",
+    "ResultCache",
+    "strategy_version",
+    "make_run_key",
+]
+
+
+@dataclass
+class CachedResult:
+    """
+    A stored backtest result.
+
+    Attributes
+    ----------
+    summary : dict
+        JSON-serialisable summary metrics of the run.
+    equity_curve : np.ndarray
+        Equity per bar.
+    """
+    summary: dict
+    equity_curve: np.ndarray
+
+
+def strategy_version(strategy: Any) -> str:
+    """
+    Derive a version hash for a strategy from its source code.
+
+    Strategies may override this by defining a ``version`` attribute. Decorated
+    functions, ``functools.partial`` objects and bound methods are unwrapped
+    first; a bound method is versioned by its whole class. When the source is
+    unavailable (e.g. defined in a REPL), the compiled bytecode, constants and
+    names are used instead. Values captured in closures and the attributes of
+    callable instances or method owners are hashed too, serialised like the
+    ``params`` of ``make_run_key``.
+
+    Args:
+        strategy: Strategy function, class or instance.
+
+    Returns:
+        str: Hex digest identifying the strategy code.
+
+    Raises:
+        TypeError: If neither source nor bytecode is available and no ``version`` is defined.
+    """
+    explicit = getattr(strategy, "version", None)
+    if isinstance(explicit, str):
+        return explicit
+    digest = hashlib.sha256()
+    _hash_strategy(strategy, digest)
+    return digest.hexdigest()
+
+
+def _hash_strategy(strategy: Any, digest: "hashlib._Hash") -> None:
+    """Feed everything identifying ``strategy``'s behaviour into ``digest``."""
+    if isinstance(strategy, functools.partial):
+        _hash_strategy(strategy.func, digest)
+        digest.update(repr((strategy.args, sorted(strategy.keywords.items()))).encode())
+        return
+    if inspect.ismethod(strategy):
+        owner = strategy.__self__
+        digest.update(strategy.__func__.__name__.encode())
+        if inspect.isclass(owner):
+            _hash_strategy(owner, digest)
+        else:
+            _hash_strategy(type(owner), digest)
+            _hash_instance_state(owner, digest)
+        return
+    if hasattr(strategy, "__wrapped__"):
+        _hash_strategy(inspect.unwrap(strategy), digest)
+        return
+    target = strategy if inspect.isfunction(strategy) or inspect.isclass(strategy) else type(strategy)
+    _hash_definition(target, strategy, digest)
+    if inspect.isfunction(strategy):
+        # Functions built by a factory differ only in the values they close over.
+        for cell in strategy.__closure__ or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                value = None
+            if value is not strategy:  # a recursive inner function closes over itself
+                _hash_value(value, digest)
+    elif not inspect.isclass(strategy):
+        _hash_instance_state(strategy, digest)
+
+
+def _hash_definition(target: Any, strategy: Any, digest: "hashlib._Hash") -> None:
+    """Hash the code of a function or class, from source when available, else bytecode."""
+    digest.update(f"{target.__module__}.{target.__qualname__}".encode())
+    try:
+        digest.update(inspect.getsource(target).encode())
+        return
+    except (OSError, TypeError):
+        pass
+    if inspect.isfunction(target):
+        _hash_code(target.__code__, digest)
+        return
+    codes = []
+    for name, member in sorted(vars(target).items()):
+        member = getattr(member, "__func__", member)
+        if inspect.isfunction(member):
+            codes.append((name, member.__code__))
+    if not codes:
+        raise TypeError(f"cannot version strategy {strategy!r}; give it a 'version' attribute")
+    for name, code in codes:
+        digest.update(name.encode())
+        _hash_code(code, digest)
+
+
+def _hash_instance_state(instance: Any, digest: "hashlib._Hash") -> None:
+    """Hash the attributes of a strategy instance, e.g. thresholds set in ``__init__``."""
+    state = dict(getattr(instance, "__dict__", {}))
+    for name in getattr(type(instance), "__slots__", ()):
+        if hasattr(instance, name):
+            state[name] = getattr(instance, name)
+    for name, value in sorted(state.items()):
+        digest.update(name.encode())
+        _hash_value(value, digest)
+
+
+def _hash_value(value: Any, digest: "hashlib._Hash") -> None:
+    """Hash captured state: code is versioned recursively, data like ``params`` in ``make_run_key``."""
+    if inspect.isfunction(value) or inspect.ismethod(value) or isinstance(value, functools.partial):
+        _hash_strategy(value, digest)
+    elif inspect.isclass(value):
+        _hash_definition(value, value, digest)
+    else:
+        digest.update(json.dumps(value, sort_keys=True, default=repr).encode())
+
+
+def _hash_code(code: Any, digest: "hashlib._Hash") -> None:
+    """Hash a code object's bytecode, names and constants, recursing into nested code."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            _hash_code(const, digest)
+        elif isinstance(const, frozenset):
+            # frozenset order depends on string hash randomisation.
+            digest.update(repr(sorted(map(repr, const))).encode())
+        else:
+            digest.update(repr(const).encode())
+
+
+def _order_state(order: Any) -> list:
+    """The fields of an open order that affect how it fills."""
+    return [
+        f"{type(order).__module__}.{type(order).__qualname__}",
+        order.order_id,
+        order.symbol,
+        order.quantity,
+        order.direction,
+        order.time_in_force,
+        order.short,
+        getattr(order, "limit_price", None),
+        getattr(order, "stop_price", None),
+    ]
+
+
+def make_run_key(processor: "CandlestickProcessor",
+                 simulation: "Simulation",
+                 params: Optional[dict] = None,
+                 ) -> str:
+    """
+    Build the cache key for running ``simulation`` over ``processor``.
+
+    Args:
+        processor: Processor holding the input data sources.
+        simulation: Simulation about to be run. Its account (including margin
+            balance and open orders), strategy, date window, cursor, last prices,
+            day-order sessions and performance tracker are all part of the key.
+        params: Strategy parameters. Must be JSON-serialisable or have a stable ``repr``.
+
+    Returns:
+        str: Hex digest uniquely identifying the run configuration.
+    """
+    account = simulation.account
+    performance = simulation.performance
+    payload = {
+        "data": processor.fingerprint(),
+        "start_date": str(simulation.start_date),
+        "end_date": str(simulation.end_date),
+        "current_time_index": simulation.current_time_index,
+        "performance": None if performance is None else [
+            f"{type(performance).__module__}.{type(performance).__qualname__}",
+            performance.periods_per_year,
+            performance.risk_free_rate,
+        ],
+        "performance_state": None if performance is None else performance.summary(),
+        "current_time": str(simulation.current_time),
+        "price_dict": sorted(simulation.price_dict.items()),
+        "day_order_sessions": sorted((k, str(v)) for k, v in simulation.day_order_sessions.items()),
+        "account": f"{type(account).__module__}.{type(account).__qualname__}",
+        "cash": account.cash,
+        "margin_balance": getattr(account, "margin_balance", None),
+        "holdings": sorted(account.holdings.items()),
+        "margin_requirements": sorted(getattr(account, "margin_requirements", {}).items()),
+        "open_orders": [_order_state(order) for _, order in sorted(account.oms.open_orders.items())],
+        "strategy": None if simulation.strategy is None else strategy_version(simulation.strategy),
+        "params": params or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk store of backtest results with size-based LRU eviction.
+
+    Each entry is a ``<key>.json`` summary plus a ``<key>.npy`` equity curve.
+    Reads refresh an entry's modification time, and when the total size
+    exceeds ``max_bytes`` the least recently used entries are removed.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory holding the cache files.
+    max_bytes : int
+        Maximum total size of the cache on disk.
+    """
+    def __init__(self, directory: Path | str, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.npy"
+
+    def __contains__(self, key: str) -> bool:
+        summary_path, curve_path = self._paths(key)
+        return summary_path.exists() and curve_path.exists()
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Return the stored result for ``key``, or None on a miss."""
+        summary_path, curve_path = self._paths(key)
+        try:
+            summary = json.loads(summary_path.read_text())
+            equity_curve = np.load(curve_path, allow_pickle=False)
+        except (FileNotFoundError, ValueError):
+            return None
+        for path in (summary_path, curve_path):
+            os.utime(path)
+        return CachedResult(summary, equity_curve)
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store ``result`` under ``key`` and evict old entries if over budget."""
+        summary_path, curve_path = self._paths(key)
+        # Write the curve first so a reader never sees a summary without its curve.
+        self._atomic_write(curve_path, lambda f: np.save(f, np.asarray(result.equity_curve, dtype=float)))
+        self._atomic_write(summary_path, lambda f: f.write(json.dumps(result.summary, default=float).encode()))
+        self.evict()
+
+    def get_or_run(self, key: str, run: Callable[[], CachedResult]) -> CachedResult:
+        """Return the stored result for ``key``, running and storing it on a miss."""
+        result = self.get(key)
+        if result is None:
+            result = run()
+            self.put(key, result)
+        return result
+
+    def run_simulation(self,
+                       simulation: "Simulation",
+                       processor: "CandlestickProcessor",
+                       params: Optional[dict] = None,
+                       ) -> CachedResult:
+        """
+        Run ``simulation`` over ``processor``, or return the stored result of an identical run.
+
+        On a miss the simulation is run with ``record_history`` enabled, and the
+        summary of its performance tracker (empty if none is attached) is stored
+        with the equity curve. On a hit the simulation is left untouched.
+
+        Args:
+            simulation: Simulation to run.
+            processor: Processor holding the input data sources.
+            params: Strategy parameters, see ``make_run_key``.
+
+        Returns:
+            CachedResult: The run's summary and equity curve.
+        """
+        def run() -> CachedResult:
+            simulation.record_history = True
+            history_start = len(simulation.performance_history)
+            simulation.run(processor)
+            summary = simulation.performance.summary() if simulation.performance is not None else {}
+            return CachedResult(summary, np.asarray(simulation.performance_history[history_start:], dtype=float))
+        return self.get_or_run(make_run_key(processor, simulation, params), run)
+
+    def size(self) -> int:
+        """Total size in bytes of the cached files."""
+        return sum(path.stat().st_size for path in self._entry_files())
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        entries: dict[str, list[Path]] = {}
+        for path in self._entry_files():
+            entries.setdefault(path.stem, []).append(path)
+        stats = {stem: [p.stat() for p in paths] for stem, paths in entries.items()}
+        total = sum(st.st_size for sts in stats.values() for st in sts)
+        for stem in sorted(stats, key=lambda s: max(st.st_mtime for st in stats[s])):
+            if total <= self.max_bytes:
+                break
+            for path, st in zip(entries[stem], stats[stem]):
+                path.unlink(missing_ok=True)
+                total -= st.st_size
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path in self._entry_files():
+            path.unlink(missing_ok=True)
+
+    def _entry_files(self) -> list[Path]:
+        return [p for p in self.directory.iterdir() if p.suffix in (".json", ".npy")]
+
+    def _atomic_write(self, path: Path, write: Callable) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
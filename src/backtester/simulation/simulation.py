@@ -1,28 +1,263 @@
 # Standard library imports
-from datetime import datetime
-from typing import Dict, Optional
-
-# Third-party imports
-import pandas as pd
+import time
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 # Local imports
 from backtester.brokerage.account import Account
 from backtester.brokerage.account import MarginAccount, CashAccount
 from backtester.brokerage.order import Order, MarketOrder, LimitOrder, StopOrder
+from backtester.brokerage.order_logic import check_order_fill
 from backtester.brokerage.order_management_system import OMS
+from backtester.simulation.instrumentation import Instrumentation
+
+# pandas and the analysis package are only needed for annotations here; keeping
+# them out of the import path lets sweep workers start without loading pandas.
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from backtester.analysis.performance import OnlinePerformance
+    from backtester.simulation.data_processor import CandlestickProcessor
 
 class Simulation:
     def __init__(
         self,
         account: Account,  # Can be either BacktestCashAccount or BacktestMarginAccount
-        start_date: pd.Timestamp = None,
-        end_date: pd.Timestamp = None
+        start_date: "pd.Timestamp" = None,
+        end_date: "pd.Timestamp" = None,
+        performance: Optional["OnlinePerformance"] = None,
+        strategy: Optional[Callable[["Simulation"], None]] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        record_history: bool = False
     ):
         self.account = account
         self.start_date = start_date
         self.end_date = end_date
         self.current_time_index = 0
+        self.current_time: Optional[datetime] = None
+        # Session date in which each open day order first became eligible to fill.
+        self.day_order_sessions: dict[str, date] = {}
         self.price_dict = {}
         self.performance_history = []
-        
-    
\ No newline at end of file
+        self.performance = performance
+        self.strategy = strategy
+        self.instrumentation = instrumentation
+        self.record_history = record_history
+
+    def submit_order(self, order: Order) -> bool:
+        """Place a new order with the account's OMS. Returns True if the OMS accepted it."""
+        accepted = self.account.oms.new_open_order(order)
+        if accepted and self.instrumentation is not None:
+            self.instrumentation.count("orders_submitted")
+        return accepted
+
+    def cancel_order(self, order_id: str) -> bool:
+        """Cancel an open order. Returns True if the OMS cancelled it."""
+        cancelled = self.account.oms.cancel_order(order_id)
+        if cancelled:
+            self.day_order_sessions.pop(order_id, None)
+            if self.instrumentation is not None:
+                self.instrumentation.count("orders_cancelled")
+        return cancelled
+
+    def expire_day_orders(self, session: date) -> int:
+        """
+        Cancel day orders whose session has ended.
+
+        A day order is valid for the session (date) of the first bar at which it
+        could fill, so an order placed at a daily close can still fill on the next
+        day's bar, while an intraday order expires at the first bar of a later date.
+
+        Args:
+            session: Date of the bar about to be processed.
+
+        Returns:
+            int: Number of orders expired.
+        """
+        expired = []
+        for order in self.account.oms.open_orders.values():
+            if order.time_in_force != "day":
+                continue
+            order_session = self.day_order_sessions.get(order.order_id)
+            if order_session is None:
+                self.day_order_sessions[order.order_id] = session
+            elif session > order_session:
+                expired.append(order.order_id)
+        for order_id in expired:
+            self.account.oms.cancel_order(order_id)
+            del self.day_order_sessions[order_id]
+        return len(expired)
+
+    def step(self, price_dict: dict[str, float], timestamp: Optional[datetime] = None) -> None:
+        """
+        Advance the simulation by one bar.
+
+        Expired day orders are cancelled, open orders are matched against the new
+        prices, the strategy is given a chance to act, and the bar is recorded.
+        Historical and live runs both go through this method.
+
+        Args:
+            price_dict: Current price for each symbol that traded in this bar.
+            timestamp: Time of the bar. Without it day orders never expire.
+        """
+        if self.instrumentation is not None:
+            self._step_instrumented(price_dict, timestamp)
+            return
+        if timestamp is not None:
+            self.current_time = timestamp
+            self.expire_day_orders(timestamp.date())
+        self.price_dict.update(price_dict)
+        traded_value = self.match_orders(price_dict)
+        if self.strategy is not None:
+            self.strategy(self)
+        self.record_performance(traded_value)
+        self.current_time_index += 1
+
+    def _step_instrumented(self, price_dict: dict[str, float], timestamp: Optional[datetime]) -> None:
+        """``step`` with each phase timed; kept separate so the default path stays untimed."""
+        instr = self.instrumentation
+        clock = time.perf_counter_ns
+        if timestamp is not None:
+            self.current_time = timestamp
+            t0 = clock()
+            expired = self.expire_day_orders(timestamp.date())
+            instr.add_time("oms", clock() - t0)
+            if expired:
+                instr.count("orders_expired", expired)
+        self.price_dict.update(price_dict)
+        traded_value = self.match_orders(price_dict)
+        if self.strategy is not None:
+            t2 = clock()
+            self.strategy(self)
+            instr.add_time("strategy", clock() - t2)
+        t3 = clock()
+        self.record_performance(traded_value)
+        instr.add_time("valuation", clock() - t3)
+        self.current_time_index += 1
+        instr.count("bars")
+
+    def run(self, data: "CandlestickProcessor") -> None:
+        """
+        Run the simulation over historical close prices.
+
+        Bars between ``start_date`` and ``end_date`` are replayed starting at
+        ``current_time_index``, so a simulation that already consumed some bars
+        (e.g. one restored from a snapshot) resumes where it left off. To continue
+        past a warm-up that was bounded by ``end_date``, set a later ``end_date``
+        (or None) before calling ``run`` again.
+
+        Args:
+            data: Processor holding one data source per symbol.
+        """
+        closes = data._merge_by_timestamp()
+        if self.start_date is not None:
+            closes = closes[closes.index >= self.start_date]
+        if self.end_date is not None:
+            closes = closes[closes.index <= self.end_date]
+        symbols = list(closes.columns)
+        timestamps = closes.index[self.current_time_index:].to_pydatetime()
+        instr = self.instrumentation
+        if instr is None:
+            for timestamp, row in zip(timestamps, closes.to_numpy()[self.current_time_index:]):
+                self.step({symbol: price for symbol, price in zip(symbols, row) if price == price}, timestamp)
+            return
+        clock = time.perf_counter_ns
+        instr.start()
+        try:
+            t0 = clock()
+            rows = closes.to_numpy()[self.current_time_index:]
+            instr.add_time("data", clock() - t0)
+            for timestamp, row in zip(timestamps, rows):
+                t1 = clock()
+                prices = {symbol: price for symbol, price in zip(symbols, row) if price == price}
+                instr.add_time("data", clock() - t1)
+                self.step(prices, timestamp)
+        finally:
+            instr.stop()
+
+    def match_orders(self, price_dict: dict[str, float]) -> float:
+        """
+        Fill every open order whose conditions are met in the current bar.
+
+        Only orders on symbols present in ``price_dict`` are checked, so a symbol
+        without a bar never fills at its stale last price.
+
+        Args:
+            price_dict: Prices of the symbols that traded in the current bar.
+
+        Returns:
+            float: Absolute notional traded.
+        """
+        if self.instrumentation is not None:
+            return self._match_orders_instrumented(price_dict)
+        traded_value = 0.0
+        for order in list(self.account.oms.open_orders.values()):
+            price = price_dict.get(order.symbol)
+            if price is None or not check_order_fill(price, order):
+                continue
+            self.fill_order(order, price)
+            traded_value += abs(order.quantity * price)
+        return traded_value
+
+    def _match_orders_instrumented(self, price_dict: dict[str, float]) -> float:
+        """``match_orders`` with order checks and fill bookkeeping (account and OMS) timed separately."""
+        instr = self.instrumentation
+        clock = time.perf_counter_ns
+        traded_value = 0.0
+        check_ns = 0
+        fills = 0
+        orders = list(self.account.oms.open_orders.values())
+        for order in orders:
+            price = price_dict.get(order.symbol)
+            t1 = clock()
+            filled = price is not None and check_order_fill(price, order)
+            check_ns += clock() - t1
+            if not filled:
+                continue
+            t2 = clock()
+            self.fill_order(order, price)
+            instr.add_time("oms", clock() - t2)
+            traded_value += abs(order.quantity * price)
+            fills += 1
+        instr.add_time("order_checks", check_ns)
+        instr.count("orders_checked", len(orders))
+        instr.count("orders_filled", fills)
+        return traded_value
+
+    def fill_order(self, order: Order, price: float) -> None:
+        """Execute an order at ``price`` and update the account's cash and holdings."""
+        signed_quantity = order.quantity if order.direction == "buy" else -order.quantity
+        self.account.cash -= signed_quantity * price
+        position = self.account.holdings.get(order.symbol, 0) + signed_quantity
+        if position == 0:
+            self.account.holdings.pop(order.symbol, None)
+        else:
+            self.account.holdings[order.symbol] = position
+        self.account.oms.execute_order(order.order_id, price)
+        self.day_order_sessions.pop(order.order_id, None)
+
+    def get_account_equity(self) -> float:
+        """Value the account at the current prices."""
+        if isinstance(self.account, MarginAccount):
+            return self.account.get_equity(self.price_dict)
+        return self.account.get_portfolio_value(self.price_dict)
+
+    def get_gross_exposure(self) -> float:
+        """Sum of absolute position values at the current prices."""
+        return sum(abs(quantity * self.price_dict[symbol]) for symbol, quantity in self.account.holdings.items())
+
+    def record_performance(self, traded_value: float = 0.0) -> None:
+        """
+        Feed the current bar into the online performance tracker, if one is attached,
+        and append the equity to ``performance_history`` when ``record_history`` is set.
+
+        Args:
+            traded_value: Absolute notional traded during the bar.
+        """
+        if self.performance is None and not self.record_history:
+            return
+        equity = self.get_account_equity()
+        if self.record_history:
+            self.performance_history.append(equity)
+        if self.performance is not None:
+            self.performance.update(equity, self.get_gross_exposure(), traded_value)
@@ -0,0 +1,199 @@
+"""
+Snapshot, restore and fork of simulation state.
+
+A snapshot captures the account (cash, holdings, margin and the OMS order
+books) together with the simulation cursor, so a long warm-up only has to be
+run once. Snapshots are plain bytes that can be written to disk to resume a
+crashed run, and ``fork_variants`` branches many variants from one warm state
+using copy-on-write process forking where the platform supports it.
+"""
+
+import os
+import pickle
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from backtester.simulation.simulation import Simulation
+
+__all__ = [
+    "snapshot",
+    "restore",
+    "save_snapshot",
+    "load_snapshot",
+    "fork_variants",
+]
+
+_MAGIC = b"BTSNAP"
+_VERSION = 1
+
+# Simulation attributes carried in a snapshot besides the account.
+_SIMULATION_FIELDS = (
+    "start_date",
+    "end_date",
+    "current_time_index",
+    "current_time",
+    "day_order_sessions",
+    "price_dict",
+    "performance_history",
+    "performance",
+    "record_history",
+)
+
+
+def snapshot(sim: Simulation) -> bytes:
+    """
+    Serialise the state of a simulation.
+
+    Args:
+        sim: Simulation to capture.
+
+    Returns:
+        bytes: Binary snapshot that can be passed to ``restore``.
+    """
+    state = {
+        "account": sim.account,
+        "simulation": {field: getattr(sim, field) for field in _SIMULATION_FIELDS},
+    }
+    return _MAGIC + bytes([_VERSION]) + pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def restore(data: bytes, strategy: Optional[Callable[[Simulation], None]] = None) -> Simulation:
+    """
+    Rebuild a simulation from a snapshot.
+
+    Strategies are code rather than state, so they are not captured and must
+    be re-attached here. The restored simulation keeps the snapshot's
+    ``current_time_index``, so ``Simulation.run`` resumes at the next bar. A
+    warm-up bounded by ``end_date`` keeps that bound; assign ``sim.end_date``
+    on the result to run further.
+
+    Args:
+        data: Bytes produced by ``snapshot``.
+        strategy: Strategy to attach to the restored simulation.
+
+    Returns:
+        Simulation: An independent simulation in the captured state.
+
+    Raises:
+        ValueError: If ``data`` is not a snapshot or has an unsupported version.
+    """
+    header = len(_MAGIC)
+    if len(data) <= header or data[:header] != _MAGIC:
+        raise ValueError("data is not a simulation snapshot")
+    if data[header] != _VERSION:
+        raise ValueError(f"unsupported snapshot version: {data[header]}")
+    state = pickle.loads(data[header + 1:])
+    sim = Simulation(state["account"], strategy=strategy)
+    for field, value in state["simulation"].items():
+        setattr(sim, field, value)
+    return sim
+
+
+def save_snapshot(sim: Simulation, file_path: Path | str) -> None:
+    """
+    Write a snapshot to disk atomically, so a crash mid-write keeps the previous one.
+
+    Args:
+        sim: Simulation to capture.
+        file_path: Destination path.
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(snapshot(sim))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+
+
+def load_snapshot(file_path: Path | str, strategy: Optional[Callable[[Simulation], None]] = None) -> Simulation:
+    """
+    Restore a simulation from a snapshot file.
+
+    Args:
+        file_path: Path written by ``save_snapshot``.
+        strategy: Strategy to attach to the restored simulation.
+
+    Returns:
+        Simulation: The restored simulation.
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Snapshot file not found: {file_path}")
+    return restore(file_path.read_bytes(), strategy)
+
+
+def fork_variants(sim: Simulation,
+                  variants: Iterable[Any],
+                  run: Callable[[Simulation, Any], Any],
+                  max_workers: int | None = None,
+                  ) -> list[Any]:
+    """
+    Run ``run(sim, variant)`` for every variant, each starting from the state of ``sim``.
+
+    On platforms with ``os.fork`` each variant runs in a forked child, which
+    shares the warm state copy-on-write with the parent. Results are pickled
+    back to the parent, so they must be picklable. Elsewhere each variant runs
+    in-process on a simulation restored from a snapshot.
+
+    Args:
+        sim: Warm simulation to branch from. It is never modified.
+        variants: Parameters distinguishing each branch.
+        run: Callable receiving a private simulation and a variant.
+        max_workers: Maximum number of concurrent children. Defaults to the CPU count.
+
+    Returns:
+        list: Results of ``run`` in the order of ``variants``.
+
+    Raises:
+        RuntimeError: If ``run`` raised in a forked child.
+    """
+    variants = list(variants)
+    if not hasattr(os, "fork"):
+        data = snapshot(sim)
+        return [run(restore(data, sim.strategy), variant) for variant in variants]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    results: list[Any] = [None] * len(variants)
+    for start in range(0, len(variants), max_workers):
+        children = []
+        for index in range(start, min(start + max_workers, len(variants))):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                _run_child(write_fd, sim, variants[index], run)
+            os.close(write_fd)
+            children.append((index, pid, read_fd))
+        # Drain and reap every child in the batch before reporting a failure, so
+        # no child is left as a zombie and no pipe is left open.
+        payloads = {}
+        for index, pid, read_fd in children:
+            try:
+                with os.fdopen(read_fd, "rb") as f:
+                    payloads[index] = f.read()
+            finally:
+                os.waitpid(pid, 0)
+        for index, _, _ in children:
+            payload = payloads.get(index)
+            if not payload:
+                raise RuntimeError(f"forked variant {index} exited without a result")
+            ok, value = pickle.loads(payload)
+            if not ok:
+                raise RuntimeError(f"variant {index} failed in forked child:\n{value}")
+            results[index] = value
+    return results
+
+
+def _run_child(write_fd: int, sim: Simulation, variant: Any, run: Callable[[Simulation, Any], Any]) -> None:
+    """Body of a forked child: run one variant, send the result and exit without cleanup."""
+    try:
+        try:
+            payload = pickle.dumps((True, run(sim, variant)), protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            payload = pickle.dumps((False, traceback.format_exc()))
+        with os.fdopen(write_fd, "wb") as f:
+            f.write(payload)
+    finally:
+        os._exit(0)
@@ -0,0 +1,142 @@
+"""
+Deterministic synthetic market data and order flow.
+
+Bars follow geometric Brownian motion with regime-switching volatility and
+occasional overnight gaps. Everything is driven by a seeded NumPy generator so
+the same arguments always produce the same data, which makes the output
+suitable for tests and benchmarks.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from backtester.brokerage.order import Order, MarketOrder, LimitOrder, StopOrder
+
+__all__ = [
+    "generate_bars",
+    "generate_orders",
+]
+
+
+def generate_bars(symbols: Sequence[str],
+                  n_bars: int,
+                  seed: int = 0,
+                  start: str = "2000-01-03",
+                  freq: str = "B",
+                  initial_price: float = 100.0,
+                  drift: float = 0.05,
+                  volatility: tuple[float, float] = (0.15, 0.45),
+                  regime_switch_prob: float = 0.01,
+                  gap_prob: float = 0.02,
+                  gap_volatility: float = 0.03,
+                  periods_per_year: int = 252,
+                  ) -> dict[str, pd.DataFrame]:
+    """
+    Generate OHLC bars for several symbols.
+
+    Args:
+        symbols: Symbols to generate.
+        n_bars: Number of bars per symbol.
+        seed: Seed for the random generator.
+        start: First timestamp.
+        freq: Pandas frequency string for the bar spacing.
+        initial_price: Opening price of the first bar.
+        drift: Annualised drift of the log price.
+        volatility: Annualised volatility in the calm and turbulent regimes.
+        regime_switch_prob: Per-bar probability of switching regime.
+        gap_prob: Per-bar probability that the open gaps away from the previous close.
+        gap_volatility: Standard deviation of the log gap size.
+        periods_per_year: Bars per year, used to scale drift and volatility.
+
+    Returns:
+        dict[str, pd.DataFrame]: Per symbol, a frame with ``timestamp``, ``open``,
+        ``high``, ``low`` and ``close`` columns, ready for ``CandlestickProcessor.add_data_frame``.
+    """
+    if n_bars < 1:
+        raise ValueError("n_bars must be at least 1")
+    rng = np.random.default_rng(seed)
+    shape = (n_bars, len(symbols))
+    dt = 1.0 / periods_per_year
+
+    # Each symbol flips between the two volatility regimes independently.
+    switches = rng.random(shape) < regime_switch_prob
+    regime = np.cumsum(switches, axis=0) % 2
+    sigma = np.where(regime == 0, volatility[0], volatility[1])
+
+    intrabar = (drift - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * rng.standard_normal(shape)
+    gaps = np.where(rng.random(shape) < gap_prob, gap_volatility * rng.standard_normal(shape), 0.0)
+    gaps[0] = 0.0
+
+    # log(open_t) = log(close_{t-1}) + gap_t and log(close_t) = log(open_t) + intrabar_t
+    log_close = np.log(initial_price) + np.cumsum(gaps + intrabar, axis=0)
+    log_open = log_close - intrabar
+    open_ = np.exp(log_open)
+    close = np.exp(log_close)
+
+    wick_scale = sigma * np.sqrt(dt) * 0.5
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.standard_normal(shape)) * wick_scale)
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.standard_normal(shape)) * wick_scale)
+
+    timestamps = pd.date_range(start, periods=n_bars, freq=freq)
+    return {
+        symbol: pd.DataFrame({
+            "timestamp": timestamps,
+            "open": open_[:, i],
+            "high": high[:, i],
+            "low": low[:, i],
+            "close": close[:, i],
+        })
+        for i, symbol in enumerate(symbols)
+    }
+
+
+def generate_orders(symbols: Sequence[str],
+                    n_orders: int,
+                    seed: int = 0,
+                    reference_prices: Optional[dict[str, float]] = None,
+                    max_quantity: int = 100,
+                    price_band: float = 0.05,
+                    id_prefix: str = "",
+                    ) -> list[Order]:
+    """
+    Generate a random mix of market, limit and stop orders.
+
+    Limit and stop prices are drawn within ``price_band`` of each symbol's
+    reference price, so a realistic share of them fill against bars from
+    ``generate_bars`` with the same initial price.
+
+    Args:
+        symbols: Symbols to trade.
+        n_orders: Number of orders.
+        seed: Seed for the random generator.
+        reference_prices: Price around which limit and stop prices are drawn. Defaults to 100 for every symbol.
+        max_quantity: Largest order quantity.
+        price_band: Maximum relative distance of limit and stop prices from the reference price.
+        id_prefix: Prefix for the generated order IDs.
+
+    Returns:
+        list[Order]: Orders with IDs ``f"{id_prefix}{i}"``.
+    """
+    rng = np.random.default_rng(seed)
+    symbol_idx = rng.integers(0, len(symbols), n_orders)
+    kinds = rng.integers(0, 3, n_orders)
+    is_buy = rng.random(n_orders) < 0.5
+    quantities = rng.integers(1, max_quantity + 1, n_orders)
+    offsets = rng.uniform(-price_band, price_band, n_orders)
+    gtc = rng.random(n_orders) < 0.5
+
+    orders: list[Order] = []
+    for i in range(n_orders):
+        symbol = symbols[symbol_idx[i]]
+        reference = reference_prices[symbol] if reference_prices else 100.0
+        args = (f"{id_prefix}{i}", symbol, int(quantities[i]), "buy" if is_buy[i] else "sell", "gtc" if gtc[i] else "day")
+        price = round(reference * (1.0 + offsets[i]), 2)
+        if kinds[i] == 0:
+            orders.append(MarketOrder(*args))
+        elif kinds[i] == 1:
+            orders.append(LimitOrder(*args, limit_price=price))
+        else:
+            orders.append(StopOrder(*args, stop_price=price))
+    return orders
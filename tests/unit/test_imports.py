@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).resolve().parents[2] / "src")
+
+# Budgets for a cold import in a fresh interpreter, in milliseconds. The total
+# includes stdlib modules such as dataclasses; the package budget covers only our
+# own modules. Override them on slower machines via the environment.
+TOTAL_IMPORT_BUDGET_S = float(os.environ.get("BACKTESTER_IMPORT_BUDGET_MS", "100")) / 1e3
+PACKAGE_IMPORT_BUDGET_S = float(os.environ.get("BACKTESTER_PACKAGE_IMPORT_BUDGET_MS", "25")) / 1e3
+
+def _run_python(code, *flags):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+def _import_times(module):
+    """Return (total, own package) cumulative import time in seconds, from -X importtime."""
+    stderr = _run_python(f"import {module}", "-X", "importtime").stderr
+    total = package = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not name.startswith(" "):
+            continue
+        if name.strip() == module:
+            total = int(cumulative_us)
+        if name.strip().startswith("backtester"):
+            package += int(self_us)
+    return total / 1e6, package / 1e6
+
+def test_brokerage_and_simulation_import_without_pandas():
+    # Arrange
+    code = (
+        "import sys\n"
+        "from backtester.brokerage import Order, OMS, Account, MarginAccount, check_order_fill\n"
+        "from backtester.simulation import Simulation\n"
+        "print(sorted(m for m in ('pandas', 'numpy') if m in sys.modules))\n"
+    )
+    # Act
+    output = _run_python(code).stdout.strip()
+    # Assert
+    assert output == "[]", f"heavy modules imported eagerly: {output}"
+
+@pytest.mark.benchmark
+def test_brokerage_import_time_budget():
+    # Arrange & Act: best of three to smooth out a cold filesystem cache
+    timings = [_import_times("backtester.brokerage") for _ in range(3)]
+    total = min(t[0] for t in timings)
+    package = min(t[1] for t in timings)
+    # Assert
+    assert total < TOTAL_IMPORT_BUDGET_S, f"backtester.brokerage took {total * 1e3:.1f}ms to import"
+    assert package < PACKAGE_IMPORT_BUDGET_S, f"backtester modules took {package * 1e3:.1f}ms to import"
+
+def test_simulation_lazy_exports():
+    # Arrange
+    import backtester.simulation as simulation
+    # Act & Assert
+    assert simulation.CandlestickProcessor.__name__ == "CandlestickProcessor"
+    assert "Simulation" in dir(simulation)
+    with pytest.raises(AttributeError):
+        simulation.DoesNotExist
+
+def test_simulation_submodule_does_not_shadow_exports():
+    # Arrange
+    code = (
+        "import backtester.simulation.snapshot\n"
+        "from backtester.simulation import restore, fork_variants\n"
+        "from backtester.simulation.snapshot import snapshot\n"
+        "print(callable(restore), callable(fork_variants), callable(snapshot))\n"
+    )
+    # Act & Assert
+    assert _run_python(code).stdout.strip() == "True True True"
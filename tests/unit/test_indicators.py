@@ -0,0 +1,92 @@
+from backtester.analysis.indicators import SMA, EMA, RollingStd, ATR, sma, ema, rolling_std, atr, IndicatorCache
+from backtester.simulation.data_processor import CandlestickProcessor
+import numpy as np
+import pandas as pd
+import pytest
+
+def _random_bars(n=200, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    high = close + rng.uniform(0, 2, n)
+    low = close - rng.uniform(0, 2, n)
+    return high, low, close
+
+def test_streaming_matches_batch():
+    # Arrange
+    high, low, close = _random_bars()
+    streams = [(SMA(10), sma(close, 10)), (EMA(10), ema(close, 10)), (RollingStd(10), rolling_std(close, 10))]
+    stream_atr = ATR(14)
+    # Act
+    outputs = [[s.update(x) for x in close] for s, _ in streams]
+    atr_output = [stream_atr.update(h, l, c) for h, l, c in zip(high, low, close)]
+    # Assert
+    for out, (_, expected) in zip(outputs, streams):
+        np.testing.assert_allclose(out, expected, equal_nan=True)
+    np.testing.assert_allclose(atr_output, atr(high, low, close, 14), equal_nan=True)
+
+def test_streaming_matches_batch_with_gap():
+    # Arrange
+    values = np.array([1, 2, np.nan, 4, 5, 6, 7, 8], dtype=float)
+    streams = [(SMA(3), sma(values, 3)), (RollingStd(3), rolling_std(values, 3))]
+    # Act
+    outputs = [[s.update(x) for x in values] for s, _ in streams]
+    # Assert
+    for out, (_, expected) in zip(outputs, streams):
+        np.testing.assert_allclose(out, expected, equal_nan=True)
+    np.testing.assert_allclose(outputs[0][-3:], [5, 6, 7])
+
+def test_indicator_cache_lru_eviction():
+    # Arrange
+    cache = IndicatorCache(maxsize=2)
+    # Act
+    cache.get_or_compute(("a",), lambda: np.zeros(1))
+    cache.get_or_compute(("b",), lambda: np.zeros(1))
+    cache.get_or_compute(("a",), lambda: np.zeros(1))  # refresh a
+    cache.get_or_compute(("c",), lambda: np.zeros(1))  # evicts b
+    # Assert
+    assert cache.hits == 1
+    assert cache.misses == 3
+    assert cache.make_key("b", "x", {}) not in cache._entries
+    assert len(cache) == 2
+
+def test_processor_get_indicator_uses_cache():
+    # Arrange
+    _, _, close = _random_bars(30)
+    df = pd.DataFrame({'date': pd.date_range('2023-01-01', periods=30), 'o': close, 'h': close, 'l': close, 'c': close})
+    processor = CandlestickProcessor()
+    processor.add_data_frame('XYZ', df, 'date', 'o', 'h', 'l', 'c')
+    # Act
+    first = processor.get_indicator('XYZ', 'sma', window=5)
+    second = processor.get_indicator('XYZ', 'sma', window=5)
+    processor.add_data_frame('XYZ', df.assign(c=df['c'] + 1), 'date', 'o', 'h', 'l', 'c')
+    third = processor.get_indicator('XYZ', 'sma', window=5)
+    # Assert
+    assert first is second
+    assert third is not first
+    np.testing.assert_allclose(third[4:], first[4:] + 1)
+    assert processor.indicator_cache.hits == 1
+    with pytest.raises(ValueError):
+        first[0] = 1.0
+    with pytest.raises(ValueError):
+        processor.get_indicator('XYZ', 'unknown')
+
+def test_shared_cache_keys_on_content_not_name():
+    # Arrange
+    cache = IndicatorCache()
+    dates = pd.date_range('2023-01-01', periods=5)
+    def make_processor(closes):
+        df = pd.DataFrame({'date': dates, 'o': closes, 'h': closes, 'l': closes, 'c': closes})
+        processor = CandlestickProcessor(indicator_cache=cache)
+        processor.add_data_frame('SPY', df, 'date', 'o', 'h', 'l', 'c')
+        return processor
+    small = make_processor([1, 2, 3, 4, 5])
+    large = make_processor([10, 20, 30, 40, 50])
+    same = make_processor([1, 2, 3, 4, 5])
+    # Act
+    small_sma = small.get_indicator('SPY', 'sma', window=2)
+    large_sma = large.get_indicator('SPY', 'sma', window=2)
+    same_sma = same.get_indicator('SPY', 'sma', window=2)
+    # Assert
+    np.testing.assert_allclose(small_sma, [np.nan, 1.5, 2.5, 3.5, 4.5], equal_nan=True)
+    np.testing.assert_allclose(large_sma, [np.nan, 15, 25, 35, 45], equal_nan=True)
+    assert same_sma is small_sma
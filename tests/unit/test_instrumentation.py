@@ -0,0 +1,95 @@
+from backtester.brokerage.account import CashAccount
+from backtester.brokerage.order import LimitOrder, MarketOrder
+from backtester.simulation.data_processor import CandlestickProcessor
+from backtester.simulation.instrumentation import Instrumentation, StackSampler
+from backtester.simulation.simulation import Simulation
+import json
+import time
+import pandas as pd
+
+def _processor(n=20):
+    closes = [100 - i for i in range(n)]
+    df = pd.DataFrame({'date': pd.date_range('2023-01-01', periods=n), 'o': closes, 'h': closes, 'l': closes, 'c': closes})
+    processor = CandlestickProcessor()
+    processor.add_data_frame('SPY', df, 'date', 'o', 'h', 'l', 'c')
+    return processor
+
+def _strategy(sim):
+    if sim.current_time_index == 0:
+        sim.submit_order(MarketOrder("m", "SPY", 1, "buy", "day"))
+        sim.submit_order(LimitOrder("l", "SPY", 1, "buy", "gtc", limit_price=90))
+        sim.submit_order(LimitOrder("x", "SPY", 1, "buy", "gtc", limit_price=1))
+    if sim.current_time_index == 5:
+        sim.cancel_order("x")
+
+def test_instrumented_run_reports_phases_and_counters():
+    # Arrange
+    account = CashAccount()
+    account.set_cash(1000)
+    instr = Instrumentation()
+    sim = Simulation(account, strategy=_strategy, instrumentation=instr)
+    # Act
+    sim.run(_processor())
+    report = json.loads(instr.to_json())
+    # Assert
+    assert set(report["phases"]) == {"data", "order_checks", "oms", "strategy", "valuation"}
+    assert report["counters"]["bars"] == 20
+    assert report["counters"]["orders_submitted"] == 3
+    assert report["counters"]["orders_filled"] == 2
+    assert report["counters"]["orders_cancelled"] == 1
+    assert report["wall_time_s"] > 0
+    assert "order_checks" in instr.to_table()
+
+def test_uninstrumented_run_matches_instrumented():
+    # Arrange
+    plain = CashAccount()
+    timed = CashAccount()
+    # Act
+    Simulation(plain, strategy=_strategy).run(_processor())
+    Simulation(timed, strategy=_strategy, instrumentation=Instrumentation()).run(_processor())
+    # Assert
+    assert plain.cash == timed.cash
+    assert plain.holdings == timed.holdings
+
+def test_stack_sampler_collects_samples():
+    # Arrange
+    sampler = StackSampler(interval=0.001)
+    instr = Instrumentation(sampler=sampler)
+    # Act
+    instr.start()
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    instr.stop()
+    # Assert
+    assert sum(sampler.samples.values()) > 0
+    assert instr.report()["samples"]
+
+def test_counters_follow_oms_outcomes():
+    # Arrange
+    instr = Instrumentation()
+    sim = Simulation(CashAccount(), instrumentation=instr)
+    # Act
+    assert sim.submit_order(MarketOrder("dup", "SPY", 1, "buy", "day"))
+    assert not sim.submit_order(MarketOrder("dup", "SPY", 1, "buy", "day"))
+    assert not sim.cancel_order("unknown")
+    # Assert
+    assert instr.counters == {"orders_submitted": 1}
+
+def test_live_runner_times_the_run():
+    # Arrange
+    from backtester.simulation.live_feed import Bar, LiveRunner
+    from datetime import datetime
+    import asyncio
+    instr = Instrumentation()
+    sim = Simulation(CashAccount(), instrumentation=instr)
+    async def feed():
+        for i in range(3):
+            yield Bar(datetime(2024, 1, 2), {"SPY": 100.0 + i})
+    # Act
+    asyncio.run(LiveRunner(sim).run(feed()))
+    report = instr.report()
+    # Assert
+    assert report["counters"]["bars"] == 3
+    assert report["wall_time_s"] > 0
+    assert report["phases"]["valuation"]["share"] > 0
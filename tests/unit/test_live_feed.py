@@ -0,0 +1,73 @@
+from backtester.analysis.performance import OnlinePerformance
+from backtester.brokerage.account import CashAccount
+from backtester.brokerage.order import LimitOrder
+from backtester.simulation.live_feed import Bar, BarQueue, LiveRunner, ReplayPublisher, file_tail_feed, socket_feed
+from backtester.simulation.simulation import Simulation
+from datetime import datetime, timedelta
+import asyncio
+
+def _bars(prices):
+    start = datetime(2024, 1, 2, 9, 30)
+    return [Bar(start + timedelta(minutes=i), {"SPY": p}) for i, p in enumerate(prices)]
+
+def _simulation():
+    account = CashAccount()
+    account.set_cash(1000)
+    sim = Simulation(account, performance=OnlinePerformance())
+    sim.submit_order(LimitOrder("1", "SPY", 2, "buy", "gtc", limit_price=98))
+    return sim
+
+def test_live_runner_over_socket_replay():
+    # Arrange
+    sim = _simulation()
+    runner = LiveRunner(sim)
+    async def main():
+        async with ReplayPublisher(_bars([100, 99, 97, 101])) as publisher:
+            return await runner.run(socket_feed(publisher.host, publisher.port), maxsize=2)
+    # Act
+    queue = asyncio.run(main())
+    # Assert
+    assert sim.current_time_index == 4
+    assert sim.account.holdings == {"SPY": 2}
+    assert sim.account.cash == 1000 - 2 * 97
+    assert sim.account.oms.executed_orders["1"].executed_price == 97
+    assert runner.latency.summary()["count"] == 4
+    assert queue.high_water_mark <= 2
+
+def test_file_tail_feed_reads_appended_bars(tmp_path):
+    # Arrange
+    path = tmp_path / "bars.jsonl"
+    bars = _bars([100, 97])
+    path.write_text(bars[0].to_json() + "\n")
+    sim = _simulation()
+    async def writer():
+        await asyncio.sleep(0.05)
+        with path.open("a") as f:
+            f.write(bars[1].to_json() + "\n")
+    async def main():
+        feed = file_tail_feed(path, poll_interval=0.01, idle_timeout=0.2)
+        await asyncio.gather(LiveRunner(sim).run(feed), writer())
+    # Act
+    asyncio.run(main())
+    # Assert
+    assert sim.current_time_index == 2
+    assert sim.account.holdings == {"SPY": 2}
+
+def test_bar_queue_applies_backpressure():
+    # Arrange
+    async def main():
+        queue = BarQueue(maxsize=1)
+        async def feed():
+            for bar in _bars([1, 2, 3]):
+                yield bar
+        producer = asyncio.create_task(queue.pump(feed()))
+        await asyncio.sleep(0.01)
+        received = [bar.prices["SPY"] async for bar in queue]
+        await producer
+        return queue, received
+    # Act
+    queue, received = asyncio.run(main())
+    # Assert
+    assert received == [1, 2, 3]
+    assert queue.blocked_puts >= 1
+    assert queue.high_water_mark == 1
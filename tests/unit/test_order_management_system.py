@@ -22,7 +22,20 @@ def test_order_management_system_cancel_order():
     assert oms.cancelled_orders[orderID] is order
     assert len(oms.open_orders) == 0
 
+def test_order_management_system_execute_order():
+    # Arrange:
+    oms = OMS()
+    order = MarketOrder("7", "SPY", 1, "buy", "day")
+    oms.new_open_order(order)
+    # Act:
+    oms.execute_order("7", 101.5)
+    # Assert:
+    assert oms.executed_orders["7"] is order
+    assert order.status == "executed"
+    assert order.executed_price == 101.5
+    assert len(oms.open_orders) == 0
+
 if __name__ == "__main__":
     test_order_management_system_new_open_order()
     test_order_management_system_cancel_order()
-    
\ No newline at end of file
+    test_order_management_system_execute_order()
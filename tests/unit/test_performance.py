@@ -0,0 +1,81 @@
+from backtester.analysis.performance import (
+    RunningMoments,
+    DrawdownTracker,
+    OnlinePerformance,
+    batch_performance,
+)
+from backtester.brokerage.account import Account
+from backtester.simulation.simulation import Simulation
+import numpy as np
+import pytest
+import warnings
+
+def test_running_moments_matches_numpy():
+    # Arrange
+    values = [0.01, -0.02, 0.005, 0.03, -0.01]
+    moments = RunningMoments()
+    # Act
+    for value in values:
+        moments.update(value)
+    # Assert
+    assert moments.mean == pytest.approx(np.mean(values))
+    assert moments.std == pytest.approx(np.std(values, ddof=1))
+
+def test_drawdown_tracker():
+    # Arrange
+    tracker = DrawdownTracker()
+    # Act
+    for equity in [100, 110, 99, 88, 105, 120, 114]:
+        tracker.update(equity)
+    # Assert
+    assert tracker.max_drawdown == pytest.approx(0.2)  # 110 -> 88
+    assert tracker.max_duration == 3  # 99, 88, 105 below the 110 peak
+
+def test_online_matches_batch():
+    # Arrange
+    rng = np.random.default_rng(0)
+    equity = 1000 * np.cumprod(1 + rng.normal(0.0005, 0.01, 500))
+    exposure = equity * rng.uniform(0.5, 1.0, 500)
+    traded = rng.uniform(0, 100, 500)
+    online = OnlinePerformance()
+    # Act
+    for e, x, t in zip(equity, exposure, traded):
+        online.update(e, x, t)
+    streamed = online.summary()
+    batch = batch_performance(equity, exposure, traded)
+    # Assert
+    assert streamed.keys() == batch.keys()
+    for key in streamed:
+        assert streamed[key] == pytest.approx(batch[key]), key
+
+@pytest.mark.parametrize("equity", [[100, 50, 0, 10, 20], [0, 0, 10, 5, 20], [-10, -5, 0, 5]])
+def test_online_matches_batch_with_zero_equity(equity):
+    # Arrange
+    online = OnlinePerformance()
+    # Act
+    for e in equity:
+        online.update(e, gross_exposure=abs(e), traded_value=1.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        batch = batch_performance(equity, np.abs(equity), np.ones(len(equity)))
+    streamed = online.summary()
+    # Assert
+    for key in streamed:
+        assert np.isfinite(batch[key]), key
+        assert streamed[key] == pytest.approx(batch[key]), key
+
+def test_simulation_record_performance():
+    # Arrange
+    account = Account()
+    account.set_cash(100)
+    account.holdings = {"SPY": 1}
+    sim = Simulation(account, performance=OnlinePerformance())
+    # Act
+    for price in [100, 50]:
+        sim.price_dict = {"SPY": price}
+        sim.record_performance()
+    # Assert
+    summary = sim.performance.summary()
+    assert summary["total_return"] == pytest.approx(-0.25)  # 200 -> 150
+    assert summary["max_drawdown"] == pytest.approx(0.25)
+    assert summary["average_exposure"] == pytest.approx((100 / 200 + 50 / 150) / 2)
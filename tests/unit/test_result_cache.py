@@ -0,0 +1,183 @@
+from backtester.brokerage.account import CashAccount, MarginAccount
+from backtester.brokerage.order import LimitOrder, StopOrder
+from backtester.simulation.data_processor import CandlestickProcessor
+from backtester.analysis.performance import OnlinePerformance
+from backtester.simulation.result_cache import CachedResult, ResultCache, make_run_key, strategy_version
+from backtester.simulation.simulation import Simulation
+import datetime
+import functools
+import numpy as np
+import os
+import pandas as pd
+import pytest
+
+def _processor(close):
+    df = pd.DataFrame({'date': ['2023-01-01', '2023-01-02'], 'o': close, 'h': close, 'l': close, 'c': close})
+    processor = CandlestickProcessor()
+    processor.add_data_frame('XYZ', df, 'date', 'o', 'h', 'l', 'c')
+    return processor
+
+def strategy_a(sim):
+    return sim
+
+def strategy_b(sim):
+    return None
+
+def _sim(account=None, strategy=strategy_a, **kwargs):
+    return Simulation(account if account is not None else CashAccount(), strategy=strategy, **kwargs)
+
+def test_make_run_key_changes_with_inputs():
+    # Arrange
+    processor = _processor([100, 101])
+    base = make_run_key(processor, _sim(), {"window": 5})
+    margin = MarginAccount()
+    margin.margin_requirements['initial_long'] = 0.6
+    resumed = _sim()
+    resumed.current_time_index = 1
+    # Act & Assert
+    assert base == make_run_key(_processor([100, 101]), _sim(), {"window": 5})
+    assert base != make_run_key(_processor([100, 102]), _sim(), {"window": 5})
+    assert base != make_run_key(processor, _sim(MarginAccount()), {"window": 5})
+    assert make_run_key(processor, _sim(MarginAccount()), {}) != make_run_key(processor, _sim(margin), {})
+    assert base != make_run_key(processor, _sim(), {"window": 6})
+    assert base != make_run_key(processor, _sim(strategy=strategy_b), {"window": 5})
+    assert base != make_run_key(processor, _sim(start_date=pd.Timestamp('2023-01-02')), {"window": 5})
+    assert base != make_run_key(processor, _sim(end_date=pd.Timestamp('2023-01-01')), {"window": 5})
+    assert base != make_run_key(processor, resumed, {"window": 5})
+    assert make_run_key(processor, _sim(performance=OnlinePerformance()), {}) != \
+        make_run_key(processor, _sim(performance=OnlinePerformance(periods_per_year=52)), {})
+    assert make_run_key(processor, _sim(performance=OnlinePerformance()), {}) != \
+        make_run_key(processor, _sim(performance=OnlinePerformance(risk_free_rate=0.001)), {})
+
+def test_make_run_key_includes_warm_state():
+    # Arrange
+    processor = _processor([100, 101])
+    def warm(**changes):
+        account = MarginAccount()
+        account.margin_balance = changes.get("margin_balance", 0.0)
+        for order in changes.get("orders", []):
+            account.oms.new_open_order(order)
+        sim = _sim(account)
+        sim.current_time_index = 1
+        sim.price_dict = changes.get("price_dict", {"XYZ": 100})
+        sim.day_order_sessions = changes.get("sessions", {})
+        return make_run_key(processor, sim, {})
+    base = warm()
+    # Act & Assert
+    assert base == warm()
+    assert base != warm(margin_balance=500.0)
+    assert base != warm(orders=[LimitOrder("1", "XYZ", 1, "buy", "gtc", limit_price=99)])
+    assert warm(orders=[LimitOrder("1", "XYZ", 1, "buy", "gtc", limit_price=99)]) != \
+        warm(orders=[LimitOrder("1", "XYZ", 1, "buy", "gtc", limit_price=98)])
+    assert warm(orders=[LimitOrder("1", "XYZ", 1, "buy", "day", limit_price=99)]) != \
+        warm(orders=[StopOrder("1", "XYZ", 1, "buy", "day", stop_price=99)])
+    assert base != warm(price_dict={"XYZ": 101})
+    assert base != warm(sessions={"1": datetime.date(2023, 1, 1)})
+
+class _StrategyA:
+    def on_bar(self, sim):
+        return 1
+
+class _StrategyB:
+    def on_bar(self, sim):
+        return 1
+
+def _threshold(sim, level):
+    return level
+
+def _other_threshold(sim, level):
+    return -level
+
+def test_strategy_version_distinguishes_bound_methods():
+    assert strategy_version(_StrategyA().on_bar) != strategy_version(_StrategyB().on_bar)
+    assert strategy_version(_StrategyA().on_bar) == strategy_version(_StrategyA().on_bar)
+
+def test_strategy_version_distinguishes_partials():
+    assert strategy_version(functools.partial(_threshold)) != strategy_version(functools.partial(_other_threshold))
+    assert strategy_version(functools.partial(_threshold, level=1)) != strategy_version(functools.partial(_threshold, level=2))
+
+def test_strategy_version_distinguishes_sourceless_lambdas():
+    # Arrange: compiled from a string, so inspect.getsource cannot find them
+    low = eval(compile("lambda s: s > 5", "<string>", "eval"))
+    high = eval(compile("lambda s: s > 6", "<string>", "eval"))
+    other_name = eval(compile("lambda s: s > x", "<string>", "eval"))
+    other_name_2 = eval(compile("lambda s: s > y", "<string>", "eval"))
+    # Act & Assert
+    assert strategy_version(low) != strategy_version(high)
+    assert strategy_version(other_name) != strategy_version(other_name_2)
+    assert strategy_version(low) == strategy_version(eval(compile("lambda s: s > 5", "<string>", "eval")))
+
+def _make_threshold_strategy(threshold):
+    def strat(sim):
+        return sim.price_dict.get("XYZ", 0) > threshold
+    return strat
+
+class _CallableStrategy:
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def __call__(self, sim):
+        return sim.price_dict.get("XYZ", 0) > self.threshold
+
+    def on_bar(self, sim):
+        return self(sim)
+
+def test_strategy_version_distinguishes_closures():
+    assert strategy_version(_make_threshold_strategy(5)) != strategy_version(_make_threshold_strategy(20))
+    assert strategy_version(_make_threshold_strategy(5)) == strategy_version(_make_threshold_strategy(5))
+
+def test_strategy_version_distinguishes_instance_state():
+    assert strategy_version(_CallableStrategy(5)) != strategy_version(_CallableStrategy(20))
+    assert strategy_version(_CallableStrategy(5).on_bar) != strategy_version(_CallableStrategy(20).on_bar)
+    assert strategy_version(_CallableStrategy(5)) == strategy_version(_CallableStrategy(5))
+
+def test_result_cache_run_simulation(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path)
+    processor = _processor([100, 110])
+    def make_sim():
+        account = CashAccount()
+        account.set_cash(100)
+        account.holdings = {"XYZ": 1}
+        return Simulation(account, performance=OnlinePerformance())
+    # Act
+    first = cache.run_simulation(make_sim(), processor)
+    untouched = make_sim()
+    second = cache.run_simulation(untouched, processor)
+    # Assert
+    np.testing.assert_array_equal(first.equity_curve, [200, 210])
+    assert first.summary["total_return"] == pytest.approx(0.05)
+    assert second.summary == first.summary
+    assert untouched.current_time_index == 0
+
+def test_result_cache_get_or_run(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path)
+    calls = []
+    def run():
+        calls.append(1)
+        return CachedResult({"sharpe": 1.5}, np.array([100.0, 101.0]))
+    # Act
+    first = cache.get_or_run("abc", run)
+    second = cache.get_or_run("abc", run)
+    # Assert
+    assert len(calls) == 1
+    assert second.summary == {"sharpe": 1.5}
+    np.testing.assert_array_equal(second.equity_curve, first.equity_curve)
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path)
+    result = CachedResult({"sharpe": 1.0}, np.zeros(1000))
+    cache.put("old", result)
+    entry_size = cache.size()
+    cache.max_bytes = 2 * entry_size
+    cache.put("new", result)
+    os.utime(tmp_path / "old.json", (0, 0))
+    os.utime(tmp_path / "old.npy", (0, 0))
+    # Act
+    cache.put("newest", result)
+    # Assert
+    assert "old" not in cache
+    assert "new" in cache and "newest" in cache
+    assert cache.size() <= cache.max_bytes
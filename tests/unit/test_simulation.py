@@ -1,3 +1,106 @@
+from backtester.brokerage.account import CashAccount
+from backtester.brokerage.order import LimitOrder, MarketOrder, StopOrder
+from backtester.simulation.data_processor import CandlestickProcessor
+from backtester.simulation.simulation import Simulation
+import pandas as pd
 
+def test_simulation_step_fills_orders():
+    # Arrange
+    account = CashAccount()
+    account.set_cash(1000)
+    sim = Simulation(account)
+    sim.submit_order(MarketOrder("1", "SPY", 3, "buy", "day"))
+    # Act
+    sim.step({"SPY": 100})
+    # Assert
+    assert account.holdings == {"SPY": 3}
+    assert account.cash == 700
+    assert "1" in account.oms.executed_orders
+    assert sim.current_time_index == 1
 
+def test_simulation_run_over_processor():
+    # Arrange
+    df = pd.DataFrame({'date': ['2023-01-01', '2023-01-02', '2023-01-03'], 'o': [100, 90, 80], 'h': [100, 90, 80], 'l': [100, 90, 80], 'c': [100, 90, 80]})
+    processor = CandlestickProcessor()
+    processor.add_data_frame('SPY', df, 'date', 'o', 'h', 'l', 'c')
+    account = CashAccount()
+    account.set_cash(1000)
+    account.holdings = {"SPY": 2}
+    def strategy(sim):
+        if sim.current_time_index == 0:
+            sim.submit_order(StopOrder("stop", "SPY", 2, "sell", "gtc", stop_price=85))
+    sim = Simulation(account, strategy=strategy)
+    # Act
+    sim.run(processor)
+    # Assert
+    assert account.holdings == {}
+    assert account.cash == 1160
+    assert account.oms.executed_orders["stop"].executed_price == 80
 
+def test_day_orders_expire_when_session_changes():
+    # Arrange
+    account = CashAccount()
+    account.set_cash(1000)
+    sim = Simulation(account)
+    day = pd.Timestamp('2023-01-02 09:30')
+    sim.submit_order(LimitOrder("day", "SPY", 1, "buy", "day", limit_price=90))
+    sim.submit_order(LimitOrder("gtc", "SPY", 1, "buy", "gtc", limit_price=90))
+    # Act
+    sim.step({"SPY": 100}, day)
+    sim.step({"SPY": 100}, day + pd.Timedelta(hours=6))
+    still_open = "day" in account.oms.open_orders
+    sim.step({"SPY": 100}, day + pd.Timedelta(days=1))
+    # Assert
+    assert still_open
+    assert account.oms.cancelled_orders["day"].status == "cancelled"
+    assert "gtc" in account.oms.open_orders
+    assert sim.day_order_sessions == {}
+
+def test_day_order_from_daily_close_fills_next_session():
+    # Arrange
+    df = pd.DataFrame({'date': ['2023-01-02', '2023-01-03', '2023-01-04'], 'o': [100, 95, 80], 'h': [100, 95, 80], 'l': [100, 95, 80], 'c': [100, 95, 80]})
+    processor = CandlestickProcessor()
+    processor.add_data_frame('SPY', df, 'date', 'o', 'h', 'l', 'c')
+    account = CashAccount()
+    account.set_cash(1000)
+    def strategy(sim):
+        if sim.current_time_index == 0:
+            sim.submit_order(LimitOrder("fills", "SPY", 1, "buy", "day", limit_price=96))
+            sim.submit_order(LimitOrder("expires", "SPY", 1, "buy", "day", limit_price=85))
+    # Act
+    Simulation(account, strategy=strategy).run(processor)
+    # Assert
+    assert account.oms.executed_orders["fills"].executed_price == 95
+    assert "expires" in account.oms.cancelled_orders
+
+def test_orders_only_match_symbols_in_the_current_bar():
+    # Arrange
+    account = CashAccount()
+    account.set_cash(1000)
+    sim = Simulation(account)
+    sim.step({"AAA": 100, "BBB": 50})
+    sim.submit_order(MarketOrder("bbb", "BBB", 1, "buy", "gtc"))
+    # Act
+    sim.step({"AAA": 101})
+    pending = "bbb" in account.oms.open_orders
+    sim.step({"AAA": 102, "BBB": 55})
+    # Assert
+    assert pending
+    assert account.oms.executed_orders["bbb"].executed_price == 55
+
+def test_multi_symbol_run_skips_symbols_without_a_bar():
+    # Arrange
+    processor = CandlestickProcessor()
+    full = pd.DataFrame({'date': ['2023-01-02', '2023-01-03', '2023-01-04'], 'o': [100, 101, 102], 'h': [100, 101, 102], 'l': [100, 101, 102], 'c': [100, 101, 102]})
+    gappy = pd.DataFrame({'date': ['2023-01-02', '2023-01-04'], 'o': [50, 55], 'h': [50, 55], 'l': [50, 55], 'c': [50, 55]})
+    processor.add_data_frame('AAA', full, 'date', 'o', 'h', 'l', 'c')
+    processor.add_data_frame('BBB', gappy, 'date', 'o', 'h', 'l', 'c')
+    account = CashAccount()
+    account.set_cash(1000)
+    def strategy(sim):
+        if sim.current_time_index == 0:
+            sim.submit_order(MarketOrder("bbb", "BBB", 1, "buy", "gtc"))
+    # Act
+    Simulation(account, strategy=strategy).run(processor)
+    # Assert
+    assert account.oms.executed_orders["bbb"].executed_price == 55
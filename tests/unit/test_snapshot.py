@@ -0,0 +1,115 @@
+from backtester.analysis.performance import OnlinePerformance
+from backtester.brokerage.account import MarginAccount
+from backtester.brokerage.order import LimitOrder, MarketOrder
+from backtester.simulation.data_processor import CandlestickProcessor
+from backtester.simulation.simulation import Simulation
+from backtester.simulation.snapshot import snapshot, restore, save_snapshot, load_snapshot, fork_variants
+import os
+import pandas as pd
+import pytest
+
+def _warm_simulation():
+    account = MarginAccount()
+    account.set_cash(1000)
+    account.margin_balance = 250
+    account.holdings = {"SPY": 3}
+    account.margin_requirements['maint_long'] = 0.4
+    account.oms.new_open_order(LimitOrder("1", "SPY", 2, "buy", "gtc", limit_price=95))
+    account.oms.new_open_order(MarketOrder("2", "SPY", 1, "sell", "day"))
+    account.oms.cancel_order("2")
+    sim = Simulation(account, performance=OnlinePerformance())
+    sim.current_time_index = 42
+    sim.price_dict = {"SPY": 100}
+    sim.record_performance()
+    return sim
+
+def test_snapshot_round_trip():
+    # Arrange
+    sim = _warm_simulation()
+    # Act
+    restored = restore(snapshot(sim))
+    # Assert
+    assert restored.current_time_index == 42
+    assert restored.price_dict == {"SPY": 100}
+    assert restored.account.cash == 1000
+    assert restored.account.margin_balance == 250
+    assert restored.account.holdings == {"SPY": 3}
+    assert restored.account.margin_requirements['maint_long'] == 0.4
+    assert restored.account.oms.open_orders["1"].limit_price == 95
+    assert restored.account.oms.cancelled_orders["2"].status == "cancelled"
+    assert restored.performance.bars == 1
+    restored.account.holdings["SPY"] = 0
+    assert sim.account.holdings["SPY"] == 3
+
+def test_snapshot_file_round_trip(tmp_path):
+    # Arrange
+    sim = _warm_simulation()
+    path = tmp_path / "warm.snap"
+    # Act
+    save_snapshot(sim, path)
+    restored = load_snapshot(path)
+    # Assert
+    assert restored.account.get_equity(restored.price_dict) == sim.account.get_equity(sim.price_dict)
+
+def test_restore_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        restore(b"not a snapshot")
+    with pytest.raises(ValueError):
+        restore(b"BTSNAP")
+
+def _buy_more(sim, quantity):
+    sim.account.holdings["SPY"] += quantity
+    return sim.account.holdings["SPY"]
+
+def test_fork_variants_branch_independently():
+    # Arrange
+    sim = _warm_simulation()
+    # Act
+    results = fork_variants(sim, [1, 2, 3], _buy_more, max_workers=2)
+    # Assert
+    assert results == [4, 5, 6]
+    assert sim.account.holdings["SPY"] == 3
+
+def test_restored_simulation_resumes_run():
+    # Arrange
+    closes = [100, 98, 96, 99, 101, 97, 95, 100, 103, 104]
+    df = pd.DataFrame({'date': pd.date_range('2023-01-01', periods=10), 'o': closes, 'h': closes, 'l': closes, 'c': closes})
+    processor = CandlestickProcessor()
+    processor.add_data_frame('SPY', df, 'date', 'o', 'h', 'l', 'c')
+    def strategy(sim):
+        i = sim.current_time_index
+        sim.submit_order(LimitOrder(str(i), "SPY", 1, "buy" if i % 2 == 0 else "sell", "gtc", limit_price=sim.price_dict["SPY"]))
+    def new_simulation():
+        account = MarginAccount()
+        account.set_cash(1000)
+        return Simulation(account, strategy=strategy, performance=OnlinePerformance())
+    uninterrupted = new_simulation()
+    uninterrupted.run(processor)
+    warm = new_simulation()
+    warm.end_date = pd.Timestamp('2023-01-05')
+    warm.run(processor)
+    # Act
+    resumed = restore(snapshot(warm), strategy)
+    resumed.end_date = None
+    resumed.run(processor)
+    # Assert
+    assert warm.current_time_index == 5
+    assert resumed.current_time_index == 10
+    assert resumed.account.cash == uninterrupted.account.cash
+    assert resumed.account.holdings == uninterrupted.account.holdings
+    assert resumed.account.oms.executed_orders.keys() == uninterrupted.account.oms.executed_orders.keys()
+    assert resumed.performance.summary() == uninterrupted.performance.summary()
+
+def _fail_on_two(sim, quantity):
+    if quantity == 2:
+        raise ValueError("boom")
+    return quantity
+
+def test_fork_variants_reaps_children_on_failure():
+    # Arrange
+    sim = _warm_simulation()
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="variant 1 failed"):
+        fork_variants(sim, [1, 2, 3], _fail_on_two, max_workers=3)
+    with pytest.raises(ChildProcessError):
+        os.waitpid(-1, os.WNOHANG)
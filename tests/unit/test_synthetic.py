@@ -0,0 +1,37 @@
+from backtester.brokerage.order import LimitOrder, MarketOrder, StopOrder
+from backtester.simulation.data_processor import CandlestickProcessor
+from backtester.simulation.synthetic import generate_bars, generate_orders
+import numpy as np
+
+def test_generate_bars_is_deterministic_and_consistent():
+    # Arrange & Act
+    first = generate_bars(["AAA", "BBB"], 500, seed=7)
+    second = generate_bars(["AAA", "BBB"], 500, seed=7)
+    other = generate_bars(["AAA", "BBB"], 500, seed=8)
+    # Assert
+    for symbol, df in first.items():
+        assert df.equals(second[symbol])
+        assert not df.equals(other[symbol])
+        assert len(df) == 500
+        assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+        assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+        assert (df["low"] > 0).all()
+    assert not np.allclose(first["AAA"]["close"], first["BBB"]["close"])
+
+def test_generate_bars_feeds_candlestick_processor():
+    # Arrange
+    processor = CandlestickProcessor()
+    # Act
+    for symbol, df in generate_bars(["AAA"], 10).items():
+        processor.add_data_frame(symbol, df, "timestamp", "open", "high", "low", "close")
+    # Assert
+    assert processor.data_sources["AAA"].shape == (10, 4)
+
+def test_generate_orders():
+    # Arrange & Act
+    orders = generate_orders(["AAA", "BBB"], 300, seed=3, id_prefix="o")
+    # Assert
+    assert [order.order_id for order in orders] == [f"o{i}" for i in range(300)]
+    assert {type(order) for order in orders} == {MarketOrder, LimitOrder, StopOrder}
+    assert all(85 <= order.limit_price <= 115 for order in orders if isinstance(order, LimitOrder))
+    assert [o.quantity for o in orders] == [o.quantity for o in generate_orders(["AAA", "BBB"], 300, seed=3)]